@@ -1,3 +1,4 @@
+import fcntl
 import json
 import streamlit as st
 import time
@@ -6,6 +7,7 @@ import subprocess
 from config import (
     PAGE_CONFIG,
     METRIC_CARD_CSS,
+    SCROLLABLE_CONTAINER_CSS,
     PAGE_OPTIONS,
     INDIA_DATA_DIR,
     DATA_FETCH_DATETIME_JSON,
@@ -15,6 +17,7 @@ from config import (
     SHARPE_SLIDER_MIN,
     SHARPE_SLIDER_MAX,
     SUBPROCESS_TIMEOUT_SECONDS,
+    UPDATE_COOLDOWN_SECONDS,
 )
 from page_functions.trendline_signals import show_trendline_signals
 from page_functions.distance_signals import show_distance_signals
@@ -25,12 +28,14 @@ from page_functions.all_signals import show_all_signals
 
 # Project root (directory where app.py lives)
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+# Held while update_trade.sh runs; its content is the time the last run completed
+UPDATE_LOCK_FILE = os.path.join(SCRIPT_DIR, ".update_trade.lock")
 
 # Set page configuration
 st.set_page_config(**PAGE_CONFIG)
 
-# Add custom CSS for metric cards
-st.markdown(METRIC_CARD_CSS, unsafe_allow_html=True)
+# Add custom CSS for metric cards and the scrollable strategy-card containers (once per run, not per card page)
+st.markdown(METRIC_CARD_CSS + SCROLLABLE_CONTAINER_CSS, unsafe_allow_html=True)
 
 # Sidebar navigation
 st.sidebar.title("📊 Navigation")
@@ -43,27 +48,46 @@ if st.sidebar.button(
     help="Run update_trade.sh: signal generation, file sync, fundamentals enrichment, bought trades update, and fresh price updates for all CSVs",
 ):
     progress = st.sidebar.empty()
-    try:
-        progress.info("Running update_trade.sh (signals + files + enrichment + prices)...")
-        r = subprocess.run(
-            ["bash", "update_trade.sh"],
-            cwd=SCRIPT_DIR,
-            capture_output=True,
-            text=True,
-            timeout=SUBPROCESS_TIMEOUT_SECONDS,
-        )
-        if r.returncode != 0:
-            st.sidebar.warning(f"update_trade.sh exited with code {r.returncode}. Continuing.")
-            if r.stderr:
-                st.sidebar.code(r.stderr[:800], language="text")
-        progress.success("✅ Data refresh completed (including all price updates)!")
-    except subprocess.TimeoutExpired:
-        progress.error("Script timed out. Please try again or run update_trade.sh manually.")
-    except Exception as e:
-        progress.error(f"Error: {e}")
-    else:
-        time.sleep(0.5)
-        st.rerun()
+    with open(UPDATE_LOCK_FILE, "a+") as lock_file:
+        try:
+            # Non-blocking: a double-click or a second session must not start a parallel run
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            progress.warning("update_trade.sh is already running. Please wait for it to finish.")
+        else:
+            lock_file.seek(0)
+            try:
+                last_completed = float(lock_file.read().strip() or 0)
+            except ValueError:
+                last_completed = 0.0
+            if time.time() - last_completed < UPDATE_COOLDOWN_SECONDS:
+                progress.info("Data was refreshed moments ago; skipping duplicate run.")
+            else:
+                try:
+                    progress.info("Running update_trade.sh (signals + files + enrichment + prices)...")
+                    r = subprocess.run(
+                        ["bash", "update_trade.sh"],
+                        cwd=SCRIPT_DIR,
+                        capture_output=True,
+                        text=True,
+                        timeout=SUBPROCESS_TIMEOUT_SECONDS,
+                    )
+                    if r.returncode != 0:
+                        st.sidebar.warning(f"update_trade.sh exited with code {r.returncode}. Continuing.")
+                        if r.stderr:
+                            st.sidebar.code(r.stderr[:800], language="text")
+                    progress.success("✅ Data refresh completed (including all price updates)!")
+                except subprocess.TimeoutExpired:
+                    progress.error("Script timed out. Please try again or run update_trade.sh manually.")
+                except Exception as e:
+                    progress.error(f"Error: {e}")
+                else:
+                    lock_file.seek(0)
+                    lock_file.truncate()
+                    lock_file.write(str(time.time()))
+                    lock_file.flush()
+                    time.sleep(0.5)
+                    st.rerun()
 
 st.sidebar.markdown("---")
 
@@ -125,18 +149,36 @@ elif selected_page in ["📈 Trendline Signals", "📏 Distance Signals"]:
     else:
         data_file = get_latest_dated_file_path(INDIA_DATA_DIR, DATA_FILES["distance_suffix"])
 
-    df = load_csv(data_file) if data_file else None
-
-    if df is not None:
-        st.sidebar.markdown("**🔍 Filters**")
-
-        # Win Rate filter (>= threshold)
-        min_available_win_rate = 0.0
+    @st.cache_data(show_spinner=False)
+    def _slider_bounds(path, mtime):
+        """Min Win_Rate / Strategy_Sharpe for the sidebar sliders, computed once per (path, mtime)."""
+        df = load_csv(path)
+        if df is None:
+            return None
+        min_win_rate = 0.0
         if 'Win_Rate' in df.columns:
             win_rates = df['Win_Rate'].dropna()
             if len(win_rates) > 0:
-                min_available_win_rate = win_rates.min()
+                min_win_rate = win_rates.min()
+        min_sharpe = float(SHARPE_SLIDER_MIN)
+        if 'Strategy_Sharpe' in df.columns:
+            sharpe_values = df['Strategy_Sharpe'].dropna()
+            if len(sharpe_values) > 0:
+                min_sharpe = float(sharpe_values.min())
+        return min_win_rate, min_sharpe
+
+    bounds = None
+    if data_file:
+        try:
+            bounds = _slider_bounds(data_file, os.path.getmtime(data_file))
+        except OSError:
+            bounds = None
+
+    if bounds is not None:
+        min_available_win_rate, min_available_sharpe = bounds
+        st.sidebar.markdown("**🔍 Filters**")
 
+        # Win Rate filter (>= threshold)
         min_win_rate = st.sidebar.slider(
             "Min Win Rate (%)",
             min_value=float(min_available_win_rate),
@@ -148,12 +190,6 @@ elif selected_page in ["📈 Trendline Signals", "📏 Distance Signals"]:
         )
 
         # Sharpe Ratio filter (>= threshold)
-        min_available_sharpe = float(SHARPE_SLIDER_MIN)
-        if 'Strategy_Sharpe' in df.columns:
-            sharpe_values = df['Strategy_Sharpe'].dropna()
-            if len(sharpe_values) > 0:
-                min_available_sharpe = float(sharpe_values.min())
-
         min_sharpe = st.sidebar.slider(
             "Min Sharpe Ratio",
             min_value=float(min_available_sharpe),
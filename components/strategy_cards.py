@@ -0,0 +1,230 @@
+"""
+Shared building blocks for the strategy cards and detail tables of the
+Potential Entry & Exit and Trades Bought pages.
+"""
+
+import functools
+from datetime import date
+from typing import Any, Dict, List
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+# Fixed-layout card columns: labels are joined once at import, cards only fill in the values
+_TRADE_DETAILS_TEMPLATE = "\n\n".join([
+    "**🎯 Trade Details**",
+    "**Symbol:** {}",
+    "**Function:** {}",
+    "**Interval:** {}",
+    "**Signal:** {}",
+    "**Signal Date:** {}",
+    "**Signal Price:** {}",
+    "**Win Rate:** {}",
+])
+_RISK_TIMING_TEMPLATE = "**⚠️ Risk & Timing**\n\n**Holding Period:** {}"
+_FUNDAMENTALS_TEMPLATE = "\n\n".join([
+    "**📈 Fundamentals**",
+    "**PE Ratio:** {}",
+    "**Industry PE:** {}",
+    "**Last Quarter Profit (Net Inc):** {}",
+    "**Same Qtr Prior Yr (Net Inc):** {}",
+])
+
+
+def table_column(df: pd.DataFrame, col: str, default: Any) -> Any:
+    """Values of a whole column for a display table, or default for every row when the column is missing."""
+    if col not in df.columns:
+        return [default] * len(df)
+    return df[col].to_numpy()
+
+
+def text_column(df: pd.DataFrame, col: str, default: str = "") -> List[str]:
+    """str(value).strip() for a whole column (default when the column is missing); NaN stays "nan" as with str()."""
+    if col not in df.columns:
+        return [default] * len(df)
+    return df[col].astype(str).str.strip().tolist()
+
+
+def numeric_column(df: pd.DataFrame, col: str) -> pd.Series:
+    """pd.to_numeric(errors="coerce") for a whole column; all-NaN when the column is missing."""
+    if col not in df.columns:
+        return pd.Series(np.nan, index=df.index)
+    return pd.to_numeric(df[col], errors="coerce")
+
+
+def format_number_column(df: pd.DataFrame, col: str, template: str) -> List[str]:
+    """template.format(value) for a whole column; "N/A" where the column is missing or a value is not numeric."""
+    if col not in df.columns:
+        return ["N/A"] * len(df)
+    num = numeric_column(df, col)
+    return num.map(template.format).where(num.notna(), "N/A").tolist()
+
+
+@functools.lru_cache(maxsize=4096)
+def format_fundamental_value(val):
+    """Format a fundamental value for display (e.g. large numbers with commas). Memoized: values repeat per symbol."""
+    if val is None or val == "No Data" or val == "N/A" or (isinstance(val, str) and val.lower() == "nan"):
+        return "No Data"
+    try:
+        numeric = float(val)
+        if abs(numeric) >= 1e6:
+            return f"{numeric:,.0f}"
+        if abs(numeric) >= 1:
+            return f"{numeric:,.2f}"
+        return f"{numeric:.2f}"
+    except (ValueError, TypeError):
+        return str(val)
+
+
+def format_fundamental_column(df: pd.DataFrame, col: str) -> List[str]:
+    """
+    Format a whole fundamentals column like format_fundamental_value, once per table.
+
+    Numeric cells are formatted vectorially; anything else (NaN, "No Data", text)
+    falls back to format_fundamental_value so the output is identical.
+    Values repeat across a symbol's signals, so each distinct value is formatted once.
+    """
+    if col not in df.columns:
+        return [format_fundamental_value("N/A")] * len(df)
+    column = df[col]
+    codes, uniques = pd.factorize(column)
+    values = pd.Series(uniques, dtype=column.dtype)
+    num = pd.to_numeric(values, errors="coerce")
+    magnitude = num.abs()
+    # Each distinct numeric value is formatted exactly once, by its magnitude bucket
+    formatted = np.empty(len(num), dtype=object)
+    for mask, fmt in (
+        (magnitude >= 1e6, "{:,.0f}"),
+        ((magnitude >= 1) & (magnitude < 1e6), "{:,.2f}"),
+        (magnitude < 1, "{:.2f}"),
+    ):
+        formatted[mask.to_numpy()] = num[mask].map(fmt.format).to_numpy()
+    # Only the non-numeric values go through the scalar formatter
+    non_numeric = num.isna()
+    if non_numeric.any():
+        formatted[non_numeric.to_numpy()] = values[non_numeric].map(format_fundamental_value).to_numpy()
+    # Broadcast back by factorize code; missing cells (code -1) are formatted cell by cell,
+    # since None and NaN format differently
+    result = np.empty(len(codes), dtype=object)
+    present = codes >= 0
+    result[present] = formatted[codes[present]]
+    if not present.all():
+        result[~present] = column[~present].map(format_fundamental_value).to_numpy()
+    return result.tolist()
+
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def build_card_contents(df: pd.DataFrame, fetch_date: date | None) -> List[Dict[str, Any]]:
+    """
+    Compose the expander title and the four column markdown blocks for every card in the table.
+    Shared by the Potential Entry & Exit and Trades Bought card pages, so both use one layout.
+
+    Cached on the filtered DataFrame and fetch date: reruns triggered by expander clicks or
+    buttons reuse the composed text instead of re-deriving it card by card.
+    """
+    # Text fields are cast and stripped once per table instead of per card
+    symbols = text_column(df, "Symbol")
+    function_names = text_column(df, "Function", "Unknown")
+    signal_types = text_column(df, "Signal_Type")
+    intervals = text_column(df, "Interval")
+    signal_dates = text_column(df, "Signal_Date")
+    if "Exit_Date" in df.columns:
+        exit_dates = df["Exit_Date"].astype(str).str.strip().where(df["Exit_Date"].notna(), "").tolist()
+    else:
+        exit_dates = [""] * len(df)
+
+    # Fundamentals are formatted once per table instead of per card
+    pe_display = format_fundamental_column(df, "PE_Ratio")
+    industry_pe_display = format_fundamental_column(df, "Industry_PE")
+    last_q_display = format_fundamental_column(df, "Last_Quarter_Profit")
+    same_q_display = format_fundamental_column(df, "Last_Year_Same_Quarter_Profit")
+
+    # Win rate and strategy metrics: one to_numeric pass per column instead of float() per card
+    win_rate_displays = format_number_column(df, "Win_Rate", "{:.2f}%")
+    if "Win_Rate_Display" in df.columns:
+        shown = df["Win_Rate_Display"].fillna("").astype(str)
+        win_rate_displays = shown.where(shown != "", pd.Series(win_rate_displays, index=df.index)).tolist()
+    cagr_displays = format_number_column(df, "Strategy_CAGR", "{:.2f}%")
+    sharpe_displays = format_number_column(df, "Strategy_Sharpe", "{:.2f}")
+
+    # Prices, P&L and holding periods: column arithmetic instead of float()/strptime() under try/except per card
+    statuses = df["Status"].tolist() if "Status" in df.columns else ["Open"] * len(df)
+    status_series = pd.Series(statuses, index=df.index)
+    signal_price = numeric_column(df, "Signal_Price")
+    today_price = numeric_column(df, "Today_Price")
+    exit_price = numeric_column(df, "Exit_Price")
+    signal_price_displays = format_number_column(df, "Signal_Price", "{:.2f}")
+    today_price_displays = format_number_column(df, "Today_Price", "{:.2f}")
+    exit_price_displays = pd.Series(format_number_column(df, "Exit_Price", "{:.2f}"), index=df.index).where(
+        status_series == "Closed", "N/A"
+    ).tolist()
+
+    # Closed trades are marked to the exit price, open trades to today's price
+    mark_price = exit_price.where(status_series == "Closed", today_price.where(status_series == "Open"))
+    profit = (mark_price - signal_price) / signal_price * 100
+    profit = profit.where(pd.Series(signal_types, index=df.index).str.upper() != "SHORT", -profit)
+    profit_displays = profit.map("{:.2f}%".format).where(profit.notna() & (signal_price > 0), "N/A").tolist()
+
+    signal_day = pd.to_datetime(pd.Series(signal_dates, index=df.index), format="%Y-%m-%d", errors="coerce")
+    exit_day = pd.to_datetime(pd.Series(exit_dates, index=df.index), format="%Y-%m-%d", errors="coerce")
+    fetch_day = pd.Timestamp(fetch_date) if fetch_date else pd.NaT
+    has_exit_date = (status_series == "Closed") & (pd.Series(exit_dates, index=df.index) != "")
+    holding_days = (exit_day - signal_day).where(has_exit_date, fetch_day - signal_day).dt.days
+    holding_days_displays = holding_days.map("{:.0f} days".format).where(holding_days.notna(), "N/A").tolist()
+
+    cards: List[Dict[str, Any]] = []
+    for card_num in range(len(df)):
+        # Extract data from row
+        symbol = symbols[card_num]
+        function_name = function_names[card_num]
+        signal_type = signal_types[card_num]
+        interval = intervals[card_num]
+        signal_date = signal_dates[card_num]
+        status = statuses[card_num]
+        exit_date = exit_dates[card_num]
+
+        win_rate_display = win_rate_displays[card_num]
+        strategy_cagr = cagr_displays[card_num]
+        strategy_sharpe = sharpe_displays[card_num]
+
+        profit_display = profit_displays[card_num]
+        holding_days_display = holding_days_displays[card_num]
+        signal_price_display = signal_price_displays[card_num]
+        today_price_display = today_price_displays[card_num]
+        exit_price_display = exit_price_displays[card_num]
+
+        # Create expander title
+        expander_title = f"🔍 {function_name} - {symbol} | {interval} | {signal_type} | {signal_date}"
+
+        # One markdown block per column (lines joined as paragraphs) instead of one st.write per field
+        status_lines = [
+            "**📊 Status & Performance**",
+            f"**Status:** {status}",
+            f"**Today Price:** {today_price_display}",
+        ]
+        if status == "Closed":
+            status_lines.append(f"**Exit Date:** {exit_date}")
+            status_lines.append(f"**Exit Price:** {exit_price_display}")
+        status_lines.append(f"**Current P&L:** {profit_display}")
+        status_lines.append(f"**Strategy CAGR:** {strategy_cagr}")
+        status_lines.append(f"**Strategy Sharpe:** {strategy_sharpe}")
+
+        cards.append({
+            "symbol": symbol,
+            "function_name": function_name,
+            "interval": interval,
+            "signal_date": signal_date,
+            "title": expander_title,
+            "columns": (
+                _TRADE_DETAILS_TEMPLATE.format(
+                    symbol, function_name, interval, signal_type, signal_date, signal_price_display, win_rate_display
+                ),
+                "\n\n".join(status_lines),
+                _RISK_TIMING_TEMPLATE.format(holding_days_display),
+                _FUNDAMENTALS_TEMPLATE.format(
+                    pe_display[card_num], industry_pe_display[card_num], last_q_display[card_num], same_q_display[card_num]
+                ),
+            ),
+        })
+    return cards
@@ -1,12 +1,10 @@
+import pandas as pd
 import streamlit as st
 
+from utils.helpers import parse_win_rate_column
+
 def create_summary_cards(df, page_name="Unknown"):
     """Create summary metric cards"""
-    # Parse data from CSV columns
-    win_rates = []
-    cagr_values = []
-    sharpe_values = []
-
     # Determine column indices based on page type
     if "Trendline" in page_name:
         cagr_col = 18
@@ -15,38 +13,28 @@ def create_summary_cards(df, page_name="Unknown"):
         cagr_col = 12
         sharpe_col = 15
 
-    for idx, row in df.iterrows():
-        # Column 3: Win Rate [%], History Tested, Number of Trades
-        win_rate_info = str(row.iloc[3]) if len(row) > 3 else ""
-        if win_rate_info and win_rate_info != 'nan':
-            if ', ' in win_rate_info:
-                parts = win_rate_info.split(', ')
-                if len(parts) >= 1:
-                    try:
-                        win_rate_pct = float(parts[0].strip('"').strip('%'))
-                        win_rates.append(win_rate_pct)
-                    except:
-                        pass
+    # Parse whole columns at once; unparseable or missing cells become NaN and are skipped
+    no_values = pd.Series(dtype=float)
 
-        # Backtested Strategy CAGR [%]
-        if len(row) > cagr_col and str(row.iloc[cagr_col]) != 'nan':
-            try:
-                cagr_str = str(row.iloc[cagr_col]).strip('%')
-                cagr_values.append(float(cagr_str))
-            except:
-                pass
+    # Column 3: Win Rate [%], History Tested, Number of Trades
+    win_rates = parse_win_rate_column(df.iloc[:, 3]) if len(df.columns) > 3 else no_values
 
-        # Backtested Strategy Sharpe Ratio
-        if len(row) > sharpe_col and str(row.iloc[sharpe_col]) != 'nan':
-            try:
-                sharpe_values.append(float(row.iloc[sharpe_col]))
-            except:
-                pass
+    # Backtested Strategy CAGR [%]
+    if len(df.columns) > cagr_col:
+        cagr_values = pd.to_numeric(df.iloc[:, cagr_col].astype(str).str.strip('%'), errors='coerce')
+    else:
+        cagr_values = no_values
+
+    # Backtested Strategy Sharpe Ratio
+    if len(df.columns) > sharpe_col:
+        sharpe_values = pd.to_numeric(df.iloc[:, sharpe_col], errors='coerce')
+    else:
+        sharpe_values = no_values
 
     # Calculate averages
-    avg_win_rate = sum(win_rates) / len(win_rates) if win_rates else 0
-    avg_cagr = sum(cagr_values) / len(cagr_values) if cagr_values else 0
-    avg_sharpe = sum(sharpe_values) / len(sharpe_values) if sharpe_values else 0
+    avg_win_rate = win_rates.mean() if win_rates.notna().any() else 0
+    avg_cagr = cagr_values.mean() if cagr_values.notna().any() else 0
+    avg_sharpe = sharpe_values.mean() if sharpe_values.notna().any() else 0
 
     col1, col2, col3, col4 = st.columns(4)
 
@@ -29,6 +29,10 @@ PAGE_OPTIONS = [
 
 # Card pagination settings (cards per tab; container height fixed, scroll to see all)
 CARDS_PER_PAGE = 30
+# Upper bound on pagination tabs; larger result sets get bigger pages instead of more tabs
+MAX_CARD_TABS = 40
+# Tabs built per rerun; beyond this a selectbox picks which group of pages is shown
+CARD_TABS_PER_GROUP = 20
 
 # Data file paths (derived from INDIA_DATA_DIR)
 POTENTIAL_ENTRY_CSV = os.path.join(INDIA_DATA_DIR, "potential_entry.csv")
@@ -57,7 +61,14 @@ SHARPE_SLIDER_MAX = 5.0
 
 # Script/process settings
 SUBPROCESS_TIMEOUT_SECONDS = 600
+# A second "Generate signals & refresh" within this many seconds of a completed run is skipped
+UPDATE_COOLDOWN_SECONDS = 30
 YFINANCE_RATE_LIMIT_DELAY = 0.5
+# Per-symbol fundamentals cache (utils.enrich_trendline_distance_fundamentals); PE moves with price, so entries last a day
+FUNDAMENTALS_CACHE_DIR = os.path.join(".cache", "fundamentals")
+FUNDAMENTALS_CACHE_TTL_SECONDS = 24 * 60 * 60
+# Symbols fetched concurrently; each worker still waits YFINANCE_RATE_LIMIT_DELAY per request
+FUNDAMENTALS_FETCH_WORKERS = 8
 
 # Trade deduplication: columns used to build unique key (same key = duplicate trade)
 TRADE_DEDUP_COLUMNS = [
@@ -1,12 +1,123 @@
 import base64
+import functools
+from concurrent.futures import ThreadPoolExecutor
 import os
 import csv
-from typing import Dict, Any, List, Optional, Tuple
+import time
+from typing import Dict, Any, List, NamedTuple, Optional, Tuple
 from datetime import date
 
 import pyotp
+import requests
 from dotenv import load_dotenv
 from growwapi import GrowwAPI
+from growwapi.groww.exceptions import GrowwAPITimeoutException
+from requests.adapters import HTTPAdapter
+
+# Order statuses that count as (partially) filled trades for the day
+_EXECUTED_STATUSES = frozenset({"EXECUTED", "PARTIALLY_EXECUTED"})
+
+# `order_type` names accepted by `place_equity_order` -> SDK constant (class attributes of GrowwAPI)
+_ORDER_TYPES = {
+    "MARKET": GrowwAPI.ORDER_TYPE_MARKET,
+    "LIMIT": GrowwAPI.ORDER_TYPE_LIMIT,
+    "STOP_LOSS": GrowwAPI.ORDER_TYPE_STOP_LOSS,
+    "STOP_LOSS_MARKET": GrowwAPI.ORDER_TYPE_STOP_LOSS_MARKET,
+}
+
+
+def _as_float(value: Any) -> float:
+    """Groww numeric field as float; missing, None, 0 and "" all read as 0.0."""
+    return float(value) if value else 0.0
+
+
+@functools.lru_cache(maxsize=None)
+def _build_totp(totp_secret: str) -> pyotp.TOTP:
+    """
+    Build a `pyotp.TOTP` from a raw `GROWW_TOTP_SECRET` value.
+
+    The secret is sanitised (spaces/dashes removed), converted from hex to
+    Base32 when it looks like hex (Groww format), and mapped from Groww's
+    0/1 variant to standard Base32 O/I. Cached per raw secret, so creating
+    several clients in one process normalises the secret only once.
+
+    Parameters
+    ----------
+    totp_secret : str
+        Secret as read from the environment.
+
+    Returns
+    -------
+    pyotp.TOTP
+        Generator for the current 6-digit code. The secret itself is only
+        validated when a code is generated (`.now()`).
+    """
+    # TOTP secret must be Base32 (A-Z, 2-7). Sanitize and handle common variants.
+    totp_secret = totp_secret.strip().replace(" ", "").replace("-", "")
+
+    # If secret is hex (e.g. Groww format), convert to Base32; bytes.fromhex rejects anything else
+    if len(totp_secret) >= 16:
+        try:
+            raw_bytes = bytes.fromhex(totp_secret)
+            totp_secret = base64.b32encode(raw_bytes).decode("ascii").rstrip("=")
+        except ValueError:
+            pass  # Not valid hex, fall through to try as Base32
+
+    totp_secret = totp_secret.upper()
+    # Groww uses Base32 variant with 0/1 - map to O/I for standard Base32
+    totp_secret = totp_secret.replace("0", "O").replace("1", "I")
+
+    return pyotp.TOTP(totp_secret)
+
+
+class _NetRow(NamedTuple):
+    """One net holding: holdings quantity +/- today's trades, with its average price."""
+
+    trading_symbol: str
+    quantity: float
+    average_price: float
+
+
+@functools.lru_cache(maxsize=None)
+def _load_env() -> None:
+    """Load `.env` into `os.environ` once per process (`load_dotenv` re-reads the file on every call)."""
+    load_dotenv()
+
+
+class _SessionGrowwAPI(GrowwAPI):
+    """
+    `GrowwAPI` whose REST calls share one keep-alive `requests.Session`.
+
+    The SDK sends every request with a bare `requests.get/post/put`, so each
+    call opens a new TCP + TLS connection. Overriding its request helpers
+    lets holdings, margin, order-list and LTP calls reuse pooled connections
+    (sized for the concurrent LTP/order-list fetches). Timeouts still raise
+    `GrowwAPITimeoutException`, as in the SDK.
+    """
+
+    def __init__(self, token: str) -> None:
+        # Set up before the SDK's __init__, which already fetches its changelog
+        self._http = requests.Session()
+        self._http.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+        super().__init__(token)
+
+    def _request_get(self, url, params=None, headers=None, timeout=None, **kwargs):
+        try:
+            return self._http.get(url, params=params, headers=headers, timeout=timeout, **kwargs)
+        except requests.Timeout as e:
+            raise GrowwAPITimeoutException() from e
+
+    def _request_post(self, url, json=None, headers=None, timeout=None, **kwargs):
+        try:
+            return self._http.post(url=url, json=json, headers=headers, timeout=timeout, **kwargs)
+        except requests.Timeout as e:
+            raise GrowwAPITimeoutException() from e
+
+    def _request_put(self, url, json=None, headers=None, timeout=None, **kwargs):
+        try:
+            return self._http.put(url=url, json=json, headers=headers, timeout=timeout, **kwargs)
+        except requests.Timeout as e:
+            raise GrowwAPITimeoutException() from e
 
 
 class GrowwTradingClient:
@@ -21,10 +132,17 @@ class GrowwTradingClient:
     - Can place simple BUY/SELL equity orders.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, ltp_cache_ttl: float = 5.0) -> None:
         """
         Initialise the underlying `GrowwAPI` client using environment variables.
 
+        Parameters
+        ----------
+        ltp_cache_ttl : float
+            Seconds an LTP fetched by `fetch_ltps_for_instruments` is reused
+            before Groww is asked again. Defaults to 5 seconds; 0 disables
+            the cache.
+
         Expected environment variables
         ------------------------------
         Option 1 (TOTP-based, recommended):
@@ -43,12 +161,16 @@ class GrowwTradingClient:
         RuntimeError
             If required env vars are missing.
         """
-        load_dotenv()
+        # "EXCHANGE_SYMBOL" -> (monotonic fetch time, LTP)
+        self.ltp_cache_ttl = ltp_cache_ttl
+        self._ltp_cache: Dict[str, Tuple[float, float]] = {}
+
+        _load_env()
 
         access_token = os.getenv("GROWW_ACCESS_TOKEN")
         if access_token:
             # Use provided access token directly
-            self.api = GrowwAPI(access_token)
+            self.api = _SessionGrowwAPI(access_token)
             return
 
         api_key = os.getenv("GROWW_API_KEY")
@@ -60,24 +182,8 @@ class GrowwTradingClient:
                 "GROWW_TOTP_SECRET in your .env file."
             )
 
-        # TOTP secret must be Base32 (A-Z, 2-7). Sanitize and handle common variants.
-        totp_secret = totp_secret.strip().replace(" ", "").replace("-", "")
-
-        # If secret looks like hex (e.g. Groww format), convert to Base32
-        if all(c in "0123456789abcdefABCDEF" for c in totp_secret) and len(totp_secret) >= 16:
-            try:
-                raw_bytes = bytes.fromhex(totp_secret)
-                totp_secret = base64.b32encode(raw_bytes).decode("ascii").rstrip("=")
-            except ValueError:
-                pass  # Not valid hex, fall through to try as Base32
-
-        totp_secret = totp_secret.upper()
-        # Groww uses Base32 variant with 0/1 - map to O/I for standard Base32
-        totp_secret = totp_secret.replace("0", "O").replace("1", "I")
-
         try:
-            totp_gen = pyotp.TOTP(totp_secret)
-            current_otp = totp_gen.now()
+            current_otp = _build_totp(totp_secret).now()
         except Exception as e:
             raise RuntimeError(
                 f"Invalid GROWW_TOTP_SECRET format. TOTP secrets must be Base32 "
@@ -86,7 +192,7 @@ class GrowwTradingClient:
             ) from e
 
         access_token = GrowwAPI.get_access_token(api_key=api_key, totp=current_otp)
-        self.api = GrowwAPI(access_token)
+        self.api = _SessionGrowwAPI(access_token)
 
     # --------------------------------------------------------------------- #
     # Symbol conversion (yfinance <-> Groww)
@@ -162,9 +268,9 @@ class GrowwTradingClient:
 
         open_holdings: List[Dict[str, Any]] = []
         for h in holdings:
-            qty = float(h.get("quantity", 0) or 0)
-            t1_qty = float(h.get("t1_quantity", 0) or 0)
-            demat_free_qty = float(h.get("demat_free_quantity", 0) or 0)
+            qty = _as_float(h.get("quantity"))
+            t1_qty = _as_float(h.get("t1_quantity"))
+            demat_free_qty = _as_float(h.get("demat_free_quantity"))
 
             if any(v != 0.0 for v in (qty, t1_qty, demat_free_qty)):
                 open_holdings.append(h)
@@ -195,8 +301,10 @@ class GrowwTradingClient:
         """
         Fetch all executed CASH-segment trades for the current trading day.
 
-        This uses `self.api.get_order_list(segment=CASH)` and filters to
-        orders that:
+        This pages through `self.api.get_order_list(segment=CASH)` until a
+        page comes back shorter than the first one (pages after the first are
+        fetched a few at a time, concurrently) or only repeats orders already
+        seen, and filters to orders that:
 
         - Have `order_status` in {"EXECUTED", "PARTIALLY_EXECUTED"}, and
         - Have `trade_date` equal to today's calendar date.
@@ -205,17 +313,53 @@ class GrowwTradingClient:
         -------
         list[dict]
             List of order dictionaries representing today's executed BUY/SELL
-            trades in the CASH segment.
+            trades in the CASH segment. If `MAX_PAGES` pages are exhausted
+            while pages still come back full, a warning is printed and the
+            orders collected so far are used.
         """
-        resp = self.api.get_order_list(
-            segment=self.api.SEGMENT_CASH,
-            page=0,
-            page_size=100,
-        )
-        orders = resp.get("order_list", resp)
+        PAGE_SIZE = 100
+        MAX_WORKERS = 4
+        MAX_PAGES = 50
+
+        def fetch_page(page: int) -> List[Dict[str, Any]]:
+            # The SDK does not forward page_size (the server default is 25), so it is only a hint
+            resp = self.api.get_order_list(
+                segment=self.api.SEGMENT_CASH,
+                page=page,
+                page_size=PAGE_SIZE,
+            )
+            return resp.get("order_list", resp)
+
+        orders = list(fetch_page(0))
+        # Whatever the server returned for a full first page is its page size
+        page_size = len(orders)
+        if page_size:
+            # More pages may follow: request them in concurrent waves until one comes back short.
+            # A page of only already-seen order ids means the API is not paging; stop there too.
+            seen_ids = {o.get("groww_order_id") for o in orders}
+            with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+                next_page = 1
+                last_page_seen = False
+                while not last_page_seen and next_page < MAX_PAGES:
+                    pages = range(next_page, min(next_page + MAX_WORKERS, MAX_PAGES))
+                    for page_orders in executor.map(fetch_page, pages):
+                        new_orders = [
+                            o for o in page_orders
+                            if o.get("groww_order_id") is None or o.get("groww_order_id") not in seen_ids
+                        ]
+                        orders.extend(new_orders)
+                        seen_ids.update(o.get("groww_order_id") for o in new_orders)
+                        if len(page_orders) < page_size or not new_orders:
+                            last_page_seen = True
+                            break
+                    next_page += MAX_WORKERS
+                if not last_page_seen:
+                    print(
+                        f"Warning: order list still returned full pages after {MAX_PAGES} pages; "
+                        f"using the {len(orders)} orders fetched so far."
+                    )
 
         today_str = date.today().isoformat()  # "YYYY-MM-DD"
-        executed_statuses = {"EXECUTED", "PARTIALLY_EXECUTED"}
 
         trades_today: List[Dict[str, Any]] = []
         for o in orders:
@@ -223,7 +367,7 @@ class GrowwTradingClient:
             trade_dt_raw = o.get("trade_date") or ""
             trade_date_str = trade_dt_raw[:10]  # first 10 chars = YYYY-MM-DD
 
-            if status in executed_statuses and trade_date_str == today_str:
+            if status in _EXECUTED_STATUSES and trade_date_str == today_str:
                 trades_today.append(o)
 
         return trades_today
@@ -246,27 +390,51 @@ class GrowwTradingClient:
         -------
         dict[str, float]
             Mapping from `"EXCHANGE_SYMBOL"` (e.g. `"NSE_RELIANCE"`) to LTP.
+            LTPs fetched less than `ltp_cache_ttl` seconds ago are served
+            from the client's cache instead of a new request.
         """
         if not instruments:
             return {}
 
-        symbols = sorted({
+        # Ordered dedup; get_ltp does not need sorted symbols, so batches follow input order
+        symbols = list(dict.fromkeys(
             f"{p['exchange']}_{p['trading_symbol']}"
             for p in instruments
             if p.get("exchange") and p.get("trading_symbol")
-        })
+        ))
 
         ltps: Dict[str, float] = {}
+        now = time.monotonic()
+        to_fetch: List[str] = []
+        for sym in symbols:
+            cached = self._ltp_cache.get(sym)
+            if cached is not None and now - cached[0] < self.ltp_cache_ttl:
+                ltps[sym] = cached[1]
+            else:
+                to_fetch.append(sym)
+
         BATCH_SIZE = 50
+        # Batches are independent HTTP calls; a few run at once, kept low for Groww's rate limits
+        MAX_WORKERS = 4
 
-        for i in range(0, len(symbols), BATCH_SIZE):
-            batch = symbols[i:i + BATCH_SIZE]
+        def fetch_batch(batch: List[str]) -> Dict[str, Any]:
             arg = batch[0] if len(batch) == 1 else tuple(batch)
-            resp = self.api.get_ltp(
+            return self.api.get_ltp(
                 segment=self.api.SEGMENT_CASH,
                 exchange_trading_symbols=arg,
             )
-            ltps.update({k: float(v) for k, v in resp.items()})
+
+        batches = [to_fetch[i:i + BATCH_SIZE] for i in range(0, len(to_fetch), BATCH_SIZE)]
+        if len(batches) > 1:
+            with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(batches))) as executor:
+                responses = list(executor.map(fetch_batch, batches))
+        else:
+            responses = [fetch_batch(batch) for batch in batches]
+
+        for resp in responses:
+            fetched = {k: float(v) for k, v in resp.items()}
+            ltps.update(fetched)
+            self._ltp_cache.update({k: (now, v) for k, v in fetched.items()})
 
         return ltps
 
@@ -325,13 +493,7 @@ class GrowwTradingClient:
         validity = validity or self.api.VALIDITY_DAY
 
         # Map string order_type to SDK constant
-        order_type_map = {
-            "MARKET": self.api.ORDER_TYPE_MARKET,
-            "LIMIT": self.api.ORDER_TYPE_LIMIT,
-            "STOP_LOSS": self.api.ORDER_TYPE_STOP_LOSS,
-            "STOP_LOSS_MARKET": self.api.ORDER_TYPE_STOP_LOSS_MARKET,
-        }
-        ot = order_type_map.get(order_type.upper(), self.api.ORDER_TYPE_MARKET)
+        ot = _ORDER_TYPES.get(order_type.upper(), self.api.ORDER_TYPE_MARKET)
 
         kwargs: Dict[str, Any] = dict(
             trading_symbol=symbol,
@@ -430,10 +592,10 @@ class GrowwTradingClient:
         total_locked_quantity = 0.0
         total_locked_value = 0.0
         for h in holdings:
-            locked_qty = float(h.get("groww_locked_quantity", 0) or 0)
+            locked_qty = _as_float(h.get("groww_locked_quantity"))
             if locked_qty == 0.0:
                 continue
-            avg_price_holding = float(h.get("average_price", 0.0) or 0.0)
+            avg_price_holding = _as_float(h.get("average_price"))
             total_locked_quantity += locked_qty
             total_locked_value += locked_qty * avg_price_holding
 
@@ -442,16 +604,13 @@ class GrowwTradingClient:
         for t in today_trades:
             symbol = t["trading_symbol"]
             side = t.get("transaction_type", "").upper()
-            qty = float(t.get("filled_quantity", 0) or 0)
-            avg_fill = float(t.get("average_fill_price", 0) or 0)
+            qty = _as_float(t.get("filled_quantity"))
+            avg_fill = _as_float(t.get("average_fill_price"))
 
-            if symbol not in trade_agg:
-                trade_agg[symbol] = {
-                    "net_qty_delta": 0.0,
-                    "buy_qty": 0.0,
-                    "buy_value": 0.0,
-                }
-            agg = trade_agg[symbol]
+            agg = trade_agg.setdefault(
+                symbol,
+                {"net_qty_delta": 0.0, "buy_qty": 0.0, "buy_value": 0.0},
+            )
 
             if side == "BUY":
                 agg["net_qty_delta"] += qty
@@ -461,81 +620,73 @@ class GrowwTradingClient:
                 agg["net_qty_delta"] -= qty
 
         # Build net holdings = base holdings +/- today's net trade quantity
-        net_holdings: List[Dict[str, Any]] = []
-        all_symbols = set(holdings_by_symbol.keys()) | set(trade_agg.keys())
-
-        for symbol in sorted(all_symbols):
+        net_holdings: List[_NetRow] = []
+        for symbol in sorted(holdings_by_symbol.keys() | trade_agg.keys()):
             base = holdings_by_symbol.get(symbol)
-            base_qty = float(base.get("quantity", 0) or 0) if base else 0.0
+            agg = trade_agg.get(symbol)
+            base_qty = _as_float(base.get("quantity")) if base else 0.0
 
-            delta = trade_agg.get(symbol, {}).get("net_qty_delta", 0.0)
+            delta = agg["net_qty_delta"] if agg else 0.0
             net_qty = base_qty + delta
 
             if net_qty == 0.0:
                 continue
 
             if base:
-                avg_price = float(base.get("average_price", 0.0) or 0.0)
+                avg_price = _as_float(base.get("average_price"))
+            elif agg and agg["buy_qty"] > 0:
+                avg_price = agg["buy_value"] / agg["buy_qty"]
             else:
-                agg = trade_agg.get(symbol, {})
-                buy_qty = agg.get("buy_qty", 0.0)
-                if buy_qty > 0:
-                    avg_price = agg.get("buy_value", 0.0) / buy_qty
-                else:
-                    avg_price = 0.0
-
-            net_holdings.append(
-                {
-                    "trading_symbol": symbol,
-                    "quantity": net_qty,
-                    "average_price": avg_price,
-                }
-            )
+                avg_price = 0.0
 
-        # Prepare list for LTP lookups
-        ltp_inputs: List[Dict[str, Any]] = []
-        for nh in net_holdings:
-            ltp_inputs.append(
-                {
-                    "exchange": "NSE",
-                    "trading_symbol": nh["trading_symbol"],
-                }
-            )
+            net_holdings.append(_NetRow(symbol, net_qty, avg_price))
 
         margin = self.fetch_available_cash()
-        ltps = self.fetch_ltps_for_instruments(ltp_inputs)
+        ltps = self.fetch_ltps_for_instruments(
+            [{"exchange": "NSE", "trading_symbol": nh.trading_symbol} for nh in net_holdings]
+        )
 
         total_net_value = 0.0
         total_invested_value = 0.0
 
+        # Single pass over the net holdings: derive each row's values once, print it and keep its CSV row
+        csv_rows: List[List[str]] = []
         print("=== Groww Net Holdings (Holdings ± Today's Trades) ===")
         if not net_holdings:
             print("No net holdings after applying today's trades.")
-        else:
-            for nh in net_holdings:
-                symbol = nh["trading_symbol"]
-                exchange = "NSE"
-                qty = float(nh.get("quantity", 0) or 0)
-                avg_price = float(nh.get("average_price", 0.0) or 0.0)
-
-                exch_sym = f"{exchange}_{symbol}"
-                ltp = float(ltps.get(exch_sym, avg_price))
-                invested_value = abs(qty) * avg_price
-                position_value = abs(qty) * ltp
-
-                total_invested_value += invested_value
-                total_net_value += position_value
-
-                print(
-                    f"{exchange:<4} {symbol:<20} "
-                    f"qty={qty:>8.2f} "
-                    f"avg={avg_price:>10.2f} "
-                    f"ltp={ltp:>10.2f} "
-                    f"inv={invested_value:>12.2f} "
-                    f"pnl={(position_value - invested_value):>12.2f}"
-                )
-
-        # Write net holdings to CSV
+        for symbol, qty, avg_price in net_holdings:
+            exchange = "NSE"
+            # Row values are floats already (as are fetch_ltps_for_instruments results); no re-coercion
+            ltp = ltps.get(f"{exchange}_{symbol}", avg_price)
+            abs_qty = abs(qty)
+            invested_value = abs_qty * avg_price
+            market_value = abs_qty * ltp
+            pnl = market_value - invested_value
+
+            total_invested_value += invested_value
+            total_net_value += market_value
+
+            print(
+                f"{exchange:<4} {symbol:<20} "
+                f"qty={qty:>8.2f} "
+                f"avg={avg_price:>10.2f} "
+                f"ltp={ltp:>10.2f} "
+                f"inv={invested_value:>12.2f} "
+                f"pnl={pnl:>12.2f}"
+            )
+            csv_rows.append(
+                [
+                    symbol,
+                    f"{qty:.2f}",
+                    f"{avg_price:.2f}",
+                    f"{ltp:.2f}",
+                    f"{invested_value:.2f}",
+                    f"{market_value:.2f}",
+                    f"{pnl:.2f}",
+                ]
+            )
+
+        # Write net holdings to CSV in one writerows call
         with open(csv_filename, mode="w", newline="") as f:
             writer = csv.writer(f)
             writer.writerow(
@@ -549,29 +700,7 @@ class GrowwTradingClient:
                     "pnl",
                 ]
             )
-            for nh in net_holdings:
-                symbol = nh["trading_symbol"]
-                exchange = "NSE"
-                qty = float(nh.get("quantity", 0) or 0)
-                avg_price = float(nh.get("average_price", 0.0) or 0.0)
-
-                exch_sym = f"{exchange}_{symbol}"
-                ltp = float(ltps.get(exch_sym, avg_price))
-                invested_value = abs(qty) * avg_price
-                market_value = abs(qty) * ltp
-                pnl = market_value - invested_value
-
-                writer.writerow(
-                    [
-                        symbol,
-                        f"{qty:.2f}",
-                        f"{avg_price:.2f}",
-                        f"{ltp:.2f}",
-                        f"{invested_value:.2f}",
-                        f"{market_value:.2f}",
-                        f"{pnl:.2f}",
-                    ]
-                )
+            writer.writerows(csv_rows)
 
         total_account_value = total_invested_value + margin["cnc_balance_available"]
 
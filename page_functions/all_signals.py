@@ -15,6 +15,7 @@ import pandas as pd
 import streamlit as st
 
 from config import ALL_SIGNALS_CSV
+from utils.data_loader import load_signals, save_signals
 from utils import (
     display_monitored_trades_metrics,
     fetch_current_price_yfinance,
@@ -31,12 +32,7 @@ def _load_all_signals_from_csv() -> List[Dict[str, Any]]:
         if not os.path.exists(ALL_SIGNALS_CSV):
             os.makedirs(os.path.dirname(ALL_SIGNALS_CSV), exist_ok=True)
             return []
-        if os.path.getsize(ALL_SIGNALS_CSV) == 0:
-            return []
-        try:
-            df = pd.read_csv(ALL_SIGNALS_CSV)
-        except pd.errors.EmptyDataError:
-            return []
+        df = load_signals(ALL_SIGNALS_CSV)
         if df.empty or len(df.columns) == 0:
             return []
         return df.to_dict("records")
@@ -45,14 +41,31 @@ def _load_all_signals_from_csv() -> List[Dict[str, Any]]:
         return []
 
 
+@st.cache_data(show_spinner=False)
+def _load_all_signals_df_cached(path: str, mtime: float) -> pd.DataFrame:
+    """Load and normalize all_signals.csv once per (path, mtime); filter reruns reuse the result."""
+    df = load_signals(path)
+    if df.empty or len(df.columns) == 0:
+        return pd.DataFrame()
+    return prepare_potential_dataframe(df)
+
+
+def _load_all_signals_df() -> pd.DataFrame:
+    """Prepared all-signals DataFrame for the page (empty if the CSV is missing or unreadable)."""
+    try:
+        if not os.path.exists(ALL_SIGNALS_CSV):
+            os.makedirs(os.path.dirname(ALL_SIGNALS_CSV), exist_ok=True)
+            return pd.DataFrame()
+        return _load_all_signals_df_cached(ALL_SIGNALS_CSV, os.path.getmtime(ALL_SIGNALS_CSV))
+    except Exception as e:
+        st.error(f"Error loading all_signals.csv: {e}")
+        return pd.DataFrame()
+
+
 def _save_all_signals_to_csv(records: List[Dict[str, Any]]) -> None:
     """Save all-signals records back to CSV."""
     try:
-        if not records:
-            pd.DataFrame().to_csv(ALL_SIGNALS_CSV, index=False)
-        else:
-            df = pd.DataFrame(records)
-            df.to_csv(ALL_SIGNALS_CSV, index=False)
+        save_signals(pd.DataFrame(records), ALL_SIGNALS_CSV)
     except Exception as e:
         st.error(f"Error saving all_signals.csv: {e}")
 
@@ -102,19 +115,17 @@ def show_all_signals() -> None:
     st.title("📚 All Signals (Distance & Trendline)")
     st.markdown("---")
 
-    records = _load_all_signals_from_csv()
+    # Reuse the same normalization as Potential Entry/Exit page so
+    # columns, Status, Win_Rate_Display, and Today Price behave identically.
+    df = _load_all_signals_df()
 
-    if not records:
+    if df.empty:
         st.info(
             "No signals found in `all_signals.csv`. "
             "Run 'Generate signals & refresh' (or utils.all_signals_fetcher) first."
         )
         return
 
-    # Reuse the same normalization as Potential Entry/Exit page so
-    # columns, Status, Win_Rate_Display, and Today Price behave identically.
-    df = prepare_potential_dataframe(records)
-
     # Sidebar filters
     st.sidebar.markdown("### 🔍 All Signals Filters")
 
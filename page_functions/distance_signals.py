@@ -1,22 +1,11 @@
 import streamlit as st
 import os
+import pandas as pd
 from config import DATA_FILES, INDIA_DATA_DIR
-from utils.data_loader import load_csv, get_latest_dated_file_path
+from utils.data_loader import load_csv_parsed, get_latest_dated_file_path
 from components.summary_cards import create_summary_cards
 
 
-def _symbol_from_row(row):
-    """Extract symbol from first column (e.g. 'ETH-USD, Long, 2026-02-06 (Price: 1978)')."""
-    if len(row) == 0:
-        return ""
-    cell = str(row.iloc[0])
-    if not cell or cell == "nan":
-        return ""
-    if ", " in cell:
-        return cell.split(", ")[0].strip('"').strip()
-    return cell.strip('"').strip()
-
-
 def show_distance_signals(min_win_rate=70.0, min_sharpe=-5.0):
     """Show the distance trading signals page"""
     st.title("📏 Distance Trading Signals")
@@ -24,14 +13,28 @@ def show_distance_signals(min_win_rate=70.0, min_sharpe=-5.0):
     distance_file = get_latest_dated_file_path(INDIA_DATA_DIR, DATA_FILES["distance_suffix"])
 
     if distance_file and os.path.exists(distance_file):
-        df_distance = load_csv(distance_file)
+        df_distance, parsed = load_csv_parsed(distance_file)
 
         if df_distance is not None:
-            # Build list of unique symbols from data
-            available_symbols = sorted({
-                _symbol_from_row(row) for _, row in df_distance.iterrows()
-                if _symbol_from_row(row)
-            })
+            # Symbol and win rate columns are parsed once per file by the loader
+            row_symbols = parsed["Symbol"]
+            available_symbols = sorted(s for s in row_symbols.unique() if s)
+
+            if len(df_distance.columns) > 3:
+                has_win_rate_info = parsed["Has_Win_Rate"]
+                win_rates = parsed["Win_Rate_Num"]
+                # Unparseable or separator-less win rates are kept, as before
+                win_rate_ok_mask = has_win_rate_info & (win_rates.isna() | (win_rates >= min_win_rate))
+            else:
+                win_rate_ok_mask = pd.Series(False, index=df_distance.index)
+
+            if len(df_distance.columns) > 15:
+                sharpe_info = df_distance.iloc[:, 15]
+                sharpe_values = pd.to_numeric(sharpe_info, errors="coerce")
+                # Non-numeric Sharpe text is kept, as before; missing (NaN/None) cells are dropped
+                sharpe_ok_mask = sharpe_info.notna() & (sharpe_values.isna() | (sharpe_values >= min_sharpe))
+            else:
+                sharpe_ok_mask = pd.Series(False, index=df_distance.index)
 
             # Sidebar: symbol filter (same pattern as Monitored Trades)
             st.sidebar.markdown("---")
@@ -64,39 +67,8 @@ def show_distance_signals(min_win_rate=70.0, min_sharpe=-5.0):
                 st.session_state["selected_symbols_distance"] = list(selected_symbols)
 
             # Apply symbol, win rate, and sharpe filters
-            filtered_indices = []
-            for idx, row in df_distance.iterrows():
-                symbol = _symbol_from_row(row)
-                symbol_ok = (symbol in selected_symbols) if selected_symbols else True
-
-                win_rate_ok = False
-                win_rate_info = str(row.iloc[3]) if len(row) > 3 else ""
-                if win_rate_info and win_rate_info != "nan":
-                    if ", " in win_rate_info:
-                        parts = win_rate_info.split(", ")
-                        if len(parts) >= 1:
-                            try:
-                                win_rate_pct = float(parts[0].strip('"').strip("%"))
-                                if win_rate_pct >= min_win_rate:
-                                    win_rate_ok = True
-                            except Exception:
-                                win_rate_ok = True
-                    else:
-                        win_rate_ok = True
-
-                sharpe_ok = False
-                if len(row) > 15 and str(row.iloc[15]) != "nan":
-                    try:
-                        sharpe_value = float(row.iloc[15])
-                        if sharpe_value >= min_sharpe:
-                            sharpe_ok = True
-                    except Exception:
-                        sharpe_ok = True
-
-                if symbol_ok and win_rate_ok and sharpe_ok:
-                    filtered_indices.append(idx)
-
-            df_filtered = df_distance.loc[filtered_indices]
+            symbol_ok_mask = row_symbols.isin(selected_symbols) if selected_symbols else True
+            df_filtered = df_distance[symbol_ok_mask & win_rate_ok_mask & sharpe_ok_mask]
 
             if len(df_filtered) != len(df_distance):
                 st.write(f"**Filtered Results:** {len(df_filtered)} signals (from {len(df_distance)} total)")
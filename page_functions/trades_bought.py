@@ -11,8 +11,8 @@ Similar structure to Potential Entry/Exit page with:
 
 import os
 import json
-from datetime import datetime, date
-from typing import List, Dict, Any
+from datetime import date
+from typing import List, Dict, Any, Tuple
 
 import pandas as pd
 import streamlit as st
@@ -26,8 +26,10 @@ from config import (
     SHARPE_SLIDER_MAX,
     DEFAULT_MIN_SHARPE,
     CARDS_PER_PAGE,
-    SCROLLABLE_CONTAINER_CSS,
+    MAX_CARD_TABS,
+    CARD_TABS_PER_GROUP,
 )
+from components.strategy_cards import build_card_contents, table_column
 from utils import (
     fetch_current_price_yfinance,
     display_monitored_trades_metrics,
@@ -77,7 +79,7 @@ def _get_data_fetch_date() -> date | None:
         d = data.get("date") or (data.get("datetime", "")[:10] if data.get("datetime") else None)
         if not d:
             return None
-        return datetime.strptime(str(d)[:10], "%Y-%m-%d").date()
+        return date.fromisoformat(str(d)[:10])
     except Exception:
         return None
 
@@ -196,8 +198,10 @@ def display_trades_table_bought(df: pd.DataFrame, title: str) -> None:
 
     fetch_date = _get_data_fetch_date()
 
-    custom_data = []
-    for _, row in df.iterrows():
+    profits = []
+    holding_periods = []
+    # Plain dict rows (as in the card loop): no Series allocated per table row
+    for row in df.to_dict("records"):
         # Calculate profit/loss
         profit = None
         try:
@@ -240,7 +244,7 @@ def display_trades_table_bought(df: pd.DataFrame, title: str) -> None:
         try:
             sig_date_str = row.get("Signal_Date")
             sig_date = (
-                datetime.strptime(str(sig_date_str), "%Y-%m-%d").date()
+                date.fromisoformat(str(sig_date_str))
                 if sig_date_str
                 else None
             )
@@ -248,7 +252,7 @@ def display_trades_table_bought(df: pd.DataFrame, title: str) -> None:
                 if row.get("Status") == "Closed":
                     exit_date_str = row.get("Exit_Date")
                     exit_d = (
-                        datetime.strptime(str(exit_date_str), "%Y-%m-%d").date()
+                        date.fromisoformat(str(exit_date_str))
                         if exit_date_str
                         else None
                     )
@@ -260,34 +264,32 @@ def display_trades_table_bought(df: pd.DataFrame, title: str) -> None:
         except Exception:
             holding_days = None
 
-        custom_row = {
-            "Function": row.get("Function", "Unknown"),
-            "Symbol": row.get("Symbol", ""),
-            "Signal_Type": row.get("Signal_Type", ""),
-            "Interval": row.get("Interval", ""),
-            "Signal_Date": row.get("Signal_Date", ""),
-            "Signal_Price": row.get("Signal_Price", ""),
-            "Today Price": row.get("Today_Price", ""),
-            "Profit (%)": profit,
-            "Holding Period (days)": holding_days,
-            "Status": row.get("Status", ""),
-            "Exit_Date": row.get("Exit_Date", ""),
-            "Exit_Price": row.get("Exit_Price", ""),
-            "Win_Rate": row.get("Win_Rate_Display", row.get("Win_Rate", "")),
-            "Strategy_CAGR": row.get("Strategy_CAGR", ""),
-            "Strategy_Sharpe": row.get("Strategy_Sharpe", ""),
-            "PE_Ratio": row.get("PE_Ratio", "N/A"),
-            "Industry_PE": row.get("Industry_PE", "N/A"),
-            "Last Qtr Profit (Net Inc)": row.get(
-                "Last_Quarter_Profit", "N/A"
-            ),
-            "Same Qtr Prior Yr (Net Inc)": row.get(
-                "Last_Year_Same_Quarter_Profit", "N/A"
-            ),
-        }
-        custom_data.append(custom_row)
-
-    custom_df = pd.DataFrame(custom_data)
+        profits.append(profit)
+        holding_periods.append(holding_days)
+
+    # Pass-through columns are taken whole from df instead of row.get per cell
+    win_rate_col = "Win_Rate_Display" if "Win_Rate_Display" in df.columns else "Win_Rate"
+    custom_df = pd.DataFrame({
+        "Function": table_column(df, "Function", "Unknown"),
+        "Symbol": table_column(df, "Symbol", ""),
+        "Signal_Type": table_column(df, "Signal_Type", ""),
+        "Interval": table_column(df, "Interval", ""),
+        "Signal_Date": table_column(df, "Signal_Date", ""),
+        "Signal_Price": table_column(df, "Signal_Price", ""),
+        "Today Price": table_column(df, "Today_Price", ""),
+        "Profit (%)": profits,
+        "Holding Period (days)": holding_periods,
+        "Status": table_column(df, "Status", ""),
+        "Exit_Date": table_column(df, "Exit_Date", ""),
+        "Exit_Price": table_column(df, "Exit_Price", ""),
+        "Win_Rate": table_column(df, win_rate_col, ""),
+        "Strategy_CAGR": table_column(df, "Strategy_CAGR", ""),
+        "Strategy_Sharpe": table_column(df, "Strategy_Sharpe", ""),
+        "PE_Ratio": table_column(df, "PE_Ratio", "N/A"),
+        "Industry_PE": table_column(df, "Industry_PE", "N/A"),
+        "Last Qtr Profit (Net Inc)": table_column(df, "Last_Quarter_Profit", "N/A"),
+        "Same Qtr Prior Yr (Net Inc)": table_column(df, "Last_Year_Same_Quarter_Profit", "N/A"),
+    })
 
     # Format numeric columns
     for col in [
@@ -329,21 +331,6 @@ def display_trades_table_bought(df: pd.DataFrame, title: str) -> None:
     st.dataframe(custom_df, use_container_width=True, height=400)
 
 
-def _format_fundamental_value(val):
-    """Format a fundamental value for display (e.g. large numbers with commas)."""
-    if val is None or val == "No Data" or val == "N/A" or (isinstance(val, str) and val.lower() == "nan"):
-        return "No Data"
-    try:
-        numeric = float(val)
-        if abs(numeric) >= 1e6:
-            return f"{numeric:,.0f}"
-        if abs(numeric) >= 1:
-            return f"{numeric:,.2f}"
-        return f"{numeric:.2f}"
-    except (ValueError, TypeError):
-        return str(val)
-
-
 def create_bought_strategy_cards(df: pd.DataFrame, title: str, tab_context: str = "") -> None:
     """
     Create individual strategy cards with pagination for bought trades.
@@ -361,139 +348,82 @@ def create_bought_strategy_cards(df: pd.DataFrame, title: str, tab_context: str
     # Display total count
     st.markdown(f"**Total Signals: {total_signals}**")
 
-    # Pagination settings for strategy cards
-    total_pages = (total_signals + CARDS_PER_PAGE - 1) // CARDS_PER_PAGE
+    # Pagination settings for strategy cards: grow the page size for large sets so the tab count stays bounded
+    page_size = max(CARDS_PER_PAGE, -(-total_signals // MAX_CARD_TABS))
+    total_pages = (total_signals + page_size - 1) // page_size
+
+    # Card text and rows are built once for the whole table; each tab slices plain lists
+    cards = build_card_contents(df, _get_data_fetch_date())
+    rows = list(zip(df.index, df.to_dict("records")))
 
     # Create tabs for pagination
-    if total_signals <= CARDS_PER_PAGE:
-        display_bought_strategy_cards_page(df, title, tab_context)
+    if total_signals <= page_size:
+        display_bought_strategy_cards_page(rows, cards, title, tab_context)
     else:
-        # Generate tab labels
-        tab_labels = []
-        for i in range(total_pages):
-            start_idx = i * CARDS_PER_PAGE + 1
-            end_idx = min((i + 1) * CARDS_PER_PAGE, total_signals)
-            tab_labels.append(f"#{start_idx}-{end_idx}")
-
-        # Create tabs for all pages
+        # Only one group of pages gets tabs per rerun; a selectbox picks the group when there are more
+        first_page, last_page = 0, total_pages
+        if total_pages > CARD_TABS_PER_GROUP:
+            group_start = st.selectbox(
+                "Signal range",
+                list(range(0, total_pages, CARD_TABS_PER_GROUP)),
+                format_func=lambda g: f"#{g * page_size + 1}-{min((g + CARD_TABS_PER_GROUP) * page_size, total_signals)}",
+                key=f"card_group_{tab_context}",
+            )
+            first_page, last_page = group_start, min(group_start + CARD_TABS_PER_GROUP, total_pages)
+
+        # Generate tab labels: page starts step by page_size, the last page ends at total_signals
+        tab_labels = [
+            f"#{start + 1}-{min(start + page_size, total_signals)}"
+            for start in range(first_page * page_size, last_page * page_size, page_size)
+        ]
+
+        # Create tabs for the pages in the selected group
         tabs = st.tabs(tab_labels)
-        for i, tab in enumerate(tabs):
+        for i, tab in zip(range(first_page, last_page), tabs):
             with tab:
-                start_idx = i * CARDS_PER_PAGE
-                end_idx = min((i + 1) * CARDS_PER_PAGE, total_signals)
-                page_df = df.iloc[start_idx:end_idx]
+                start_idx = i * page_size
+                end_idx = min((i + 1) * page_size, total_signals)
                 st.markdown(f"**Showing signals {start_idx + 1} to {end_idx} of {total_signals}**")
                 pagination_context = f"{tab_context}_page{i}"
-                display_bought_strategy_cards_page(page_df, title, pagination_context)
+                display_bought_strategy_cards_page(
+                    rows[start_idx:end_idx], cards[start_idx:end_idx], title, pagination_context
+                )
 
 
-def display_bought_strategy_cards_page(df: pd.DataFrame, title: str, tab_context: str = "") -> None:
+def display_bought_strategy_cards_page(
+    rows: List[Tuple[Any, Dict[str, Any]]], cards: List[Dict[str, Any]], title: str, tab_context: str = ""
+) -> None:
     """Display strategy cards for bought trades on a given page with scrollable container."""
-    if len(df) == 0:
+    if not rows:
         st.warning("No data to display on this page.")
         return
 
-    # Add custom CSS for scrollable container
-    st.markdown(SCROLLABLE_CONTAINER_CSS, unsafe_allow_html=True)
-
-    # Get data fetch date for holding period calculation
-    fetch_date = _get_data_fetch_date()
-
     # Create scrollable container for cards
     with st.container(height=600, border=True):
         # Display strategy cards in scrollable area
-        for card_num, (idx, row) in enumerate(df.iterrows()):
-            # Extract data from row
-            symbol = str(row.get("Symbol", "")).strip()
-            function_name = str(row.get("Function", "Unknown")).strip()
-            signal_type = str(row.get("Signal_Type", "")).strip()
-            interval = str(row.get("Interval", "")).strip()
-            signal_date = str(row.get("Signal_Date", "")).strip()
-            signal_price = row.get("Signal_Price", "N/A")
-            today_price = row.get("Today_Price", "N/A")
-            status = row.get("Status", "Open")
-            exit_date = str(row.get("Exit_Date", "")).strip() if pd.notna(row.get("Exit_Date")) else ""
-            exit_price = row.get("Exit_Price", "N/A")
-            
-            # Win rate
-            win_rate_display = row.get("Win_Rate_Display", "")
-            if not win_rate_display and pd.notna(row.get("Win_Rate")):
-                win_rate_display = f"{float(row.get('Win_Rate')):.2f}%"
-            if not win_rate_display:
-                win_rate_display = "N/A"
-            
-            # Strategy metrics
-            strategy_cagr = row.get("Strategy_CAGR", "N/A")
-            if pd.notna(strategy_cagr) and strategy_cagr != "N/A":
-                try:
-                    strategy_cagr = f"{float(strategy_cagr):.2f}%"
-                except (ValueError, TypeError):
-                    strategy_cagr = "N/A"
-            
-            strategy_sharpe = row.get("Strategy_Sharpe", "N/A")
-            if pd.notna(strategy_sharpe) and strategy_sharpe != "N/A":
-                try:
-                    strategy_sharpe = f"{float(strategy_sharpe):.2f}"
-                except (ValueError, TypeError):
-                    strategy_sharpe = "N/A"
-            
-            # Calculate profit/loss
-            profit_display = "N/A"
-            try:
-                sig_price = float(signal_price) if pd.notna(signal_price) else None
-                sig_type_upper = signal_type.upper()
-                
-                if status == "Closed" and pd.notna(exit_price):
-                    ex_price = float(exit_price)
-                    if sig_price and sig_price > 0:
-                        profit = ((ex_price - sig_price) / sig_price) * 100
-                        if sig_type_upper == "SHORT":
-                            profit = -profit
-                        profit_display = f"{profit:.2f}%"
-                elif status == "Open" and pd.notna(today_price):
-                    curr_price = float(today_price)
-                    if sig_price and sig_price > 0:
-                        profit = ((curr_price - sig_price) / sig_price) * 100
-                        if sig_type_upper == "SHORT":
-                            profit = -profit
-                        profit_display = f"{profit:.2f}%"
-            except (ValueError, TypeError):
-                profit_display = "N/A"
-            
-            # Calculate holding period
-            holding_days_display = "N/A"
-            try:
-                sig_date = datetime.strptime(signal_date, "%Y-%m-%d").date() if signal_date else None
-                if sig_date:
-                    if status == "Closed" and exit_date:
-                        ex_date = datetime.strptime(exit_date, "%Y-%m-%d").date()
-                        holding_days = (ex_date - sig_date).days
-                        holding_days_display = f"{holding_days} days"
-                    elif fetch_date:
-                        holding_days = (fetch_date - sig_date).days
-                        holding_days_display = f"{holding_days} days"
-            except Exception:
-                holding_days_display = "N/A"
-            
-            # Fundamentals
-            fundamentals = {
-                "PE_Ratio": row.get("PE_Ratio", "N/A"),
-                "Industry_PE": row.get("Industry_PE", "N/A"),
-                "Last_Quarter_Profit": row.get("Last_Quarter_Profit", "N/A"),
-                "Last_Year_Same_Quarter_Profit": row.get("Last_Year_Same_Quarter_Profit", "N/A"),
-            }
-            
-            # Format prices
-            signal_price_display = f"{float(signal_price):.2f}" if pd.notna(signal_price) else "N/A"
-            today_price_display = f"{float(today_price):.2f}" if pd.notna(today_price) else "N/A"
-            exit_price_display = f"{float(exit_price):.2f}" if pd.notna(exit_price) and status == "Closed" else "N/A"
-            
-            # Create expander title
-            expander_title = f"🔍 {function_name} - {symbol} | {interval} | {signal_type} | {signal_date}"
-            
-            with st.expander(expander_title, expanded=False):
+        # rows holds (index, record) pairs; card holds the cached text for the same row
+        for card_num, ((idx, row), card) in enumerate(zip(rows, cards)):
+            symbol = card["symbol"]
+            function_name = card["function_name"]
+            interval = card["interval"]
+            signal_date = card["signal_date"]
+
+            # One key suffix per card, shared by its expander and button keys
+            card_key = f"{tab_context}_{card_num}_{idx}"
+
+            # Stateful expander: toggling reruns the script, so collapsed cards skip their body entirely
+            expander = st.expander(
+                card["title"],
+                expanded=False,
+                key=f"card_{card_key}",
+                on_change="rerun",
+            )
+            if not expander.open:
+                continue
+
+            with expander:
                 # Remove button at the top
-                remove_key = f"remove_bought_{tab_context}_{card_num}_{idx}"
+                remove_key = f"remove_bought_{card_key}"
                 if st.button("🗑️ Remove from Bought", key=remove_key, type="secondary"):
                     # Remove this trade from bought list
                     records = _load_bought_from_csv(TRADES_BOUGHT_CSV)
@@ -519,43 +449,9 @@ def display_bought_strategy_cards_page(df: pd.DataFrame, title: str, tab_context
                 st.markdown("**📋 Key Trade Information**")
                 
                 # Create four columns
-                col1, col2, col3, col4 = st.columns(4)
-                
-                with col1:
-                    st.markdown("**🎯 Trade Details**")
-                    st.write(f"**Symbol:** {symbol}")
-                    st.write(f"**Function:** {function_name}")
-                    st.write(f"**Interval:** {interval}")
-                    st.write(f"**Signal:** {signal_type}")
-                    st.write(f"**Signal Date:** {signal_date}")
-                    st.write(f"**Signal Price:** {signal_price_display}")
-                    st.write(f"**Win Rate:** {win_rate_display}")
-                
-                with col2:
-                    st.markdown("**📊 Status & Performance**")
-                    st.write(f"**Status:** {status}")
-                    st.write(f"**Today Price:** {today_price_display}")
-                    if status == "Closed":
-                        st.write(f"**Exit Date:** {exit_date}")
-                        st.write(f"**Exit Price:** {exit_price_display}")
-                    st.write(f"**Current P&L:** {profit_display}")
-                    st.write(f"**Strategy CAGR:** {strategy_cagr}")
-                    st.write(f"**Strategy Sharpe:** {strategy_sharpe}")
-                
-                with col3:
-                    st.markdown("**⚠️ Risk & Timing**")
-                    st.write(f"**Holding Period:** {holding_days_display}")
-                
-                with col4:
-                    st.markdown("**📈 Fundamentals**")
-                    pe = fundamentals.get("PE_Ratio", "N/A")
-                    ind_pe = fundamentals.get("Industry_PE", "N/A")
-                    last_q = fundamentals.get("Last_Quarter_Profit", "N/A")
-                    same_q = fundamentals.get("Last_Year_Same_Quarter_Profit", "N/A")
-                    st.write(f"**PE Ratio:** {_format_fundamental_value(pe)}")
-                    st.write(f"**Industry PE:** {_format_fundamental_value(ind_pe)}")
-                    st.write(f"**Last Quarter Profit (Net Inc):** {_format_fundamental_value(last_q)}")
-                    st.write(f"**Same Qtr Prior Yr (Net Inc):** {_format_fundamental_value(same_q)}")
+                for col, column_markdown in zip(st.columns(4), card["columns"]):
+                    with col:
+                        st.markdown(column_markdown)
 
 
 def _load_net_holdings() -> pd.DataFrame:
@@ -1,50 +1,24 @@
-import os
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, List, Tuple, Union
 
 import pandas as pd
 
-from config import INDIA_DATA_DIR, DATA_FILES, TRADE_DEDUP_COLUMNS, ALL_SIGNALS_CSV
-from utils.data_loader import get_latest_dated_file_path
-from utils.entry_exit_fetcher import build_standard_record
+from config import INDIA_DATA_DIR, DATA_FILES, ALL_SIGNALS_CSV
+from utils.data_loader import get_latest_dated_file_path, read_csv_fast, load_signals, save_signals
+from utils.entry_exit_fetcher import RAW_SIGNAL_COLUMNS, build_standard_records_df, get_dedup_keys
 from utils import fetch_current_price_yfinance
 
 
-def load_existing_csv(path: str) -> pd.DataFrame:
-    """Load a CSV if it exists, otherwise return empty DataFrame."""
-    if not os.path.exists(path) or os.path.getsize(path) == 0:
-        return pd.DataFrame()
-    try:
-        return pd.read_csv(path)
-    except pd.errors.EmptyDataError:
-        return pd.DataFrame()
-
-
-def get_trade_dedup_key_from_record(record: Dict[str, Any]) -> str:
-    """Build deduplication key using TRADE_DEDUP_COLUMNS."""
-    parts: List[str] = []
-    for col in TRADE_DEDUP_COLUMNS:
-        val = str(record.get(col, "")).strip()
-        if col == "Signal_Type":
-            val = "Short" if "short" in val.lower() else "Long"
-        parts.append(val)
-    return "|".join(parts)
-
-
-def save_records_to_csv(path: str, records: List[Dict[str, Any]]) -> None:
+def save_records_to_csv(path: str, records: Union[pd.DataFrame, List[Dict[str, Any]]]) -> None:
     """
-    Save records to CSV using **only** the columns required by the app.
+    Save records (a DataFrame or list of dicts) to CSV using **only** the columns required by the app.
+
+    Raw_Data is never part of the core columns, so it is dropped by the column selection below.
     """
-    if not records:
-        pd.DataFrame().to_csv(path, index=False)
+    if len(records) == 0:
+        save_signals(pd.DataFrame(), path)
         return
 
-    flattened: List[Dict[str, Any]] = []
-    for rec in records:
-        rec_copy = dict(rec)
-        rec_copy.pop("Raw_Data", None)
-        flattened.append(rec_copy)
-
-    df = pd.DataFrame(flattened)
+    df = pd.DataFrame(records)
 
     cols_to_drop = [c for c in ("Signal_Open_Price", "Signal Open Price") if c in df.columns]
     if cols_to_drop:
@@ -82,21 +56,14 @@ def save_records_to_csv(path: str, records: List[Dict[str, Any]]) -> None:
     if "Signal_Date" in df.columns:
         df = df.sort_values(by="Signal_Date", ascending=False, na_position="last")
 
-    df.to_csv(path, index=False)
+    save_signals(df, path)
 
 
 def update_today_prices_for_all_signals(path: str) -> None:
     """
     After all_signals.csv is (re)built, update today's price for each symbol.
     """
-    if not os.path.exists(path) or os.path.getsize(path) == 0:
-        return
-
-    try:
-        df = pd.read_csv(path)
-    except pd.errors.EmptyDataError:
-        return
-
+    df = load_signals(path)
     if df.empty or "Symbol" not in df.columns:
         return
 
@@ -115,7 +82,7 @@ def update_today_prices_for_all_signals(path: str) -> None:
     df["Today_Price"] = prices
     if "Current_Price" in df.columns:
         df = df.drop(columns=["Current_Price"])
-    df.to_csv(path, index=False)
+    save_signals(df, path)
 
 
 def main() -> None:
@@ -133,31 +100,29 @@ def main() -> None:
 
     dfs_with_function: List[Tuple[pd.DataFrame, str]] = []
     if distance_path:
-        df_distance = pd.read_csv(distance_path)
+        df_distance = read_csv_fast(distance_path, columns=RAW_SIGNAL_COLUMNS)
         dfs_with_function.append((df_distance, "Distance"))
     if trend_path:
-        df_trend = pd.read_csv(trend_path)
+        df_trend = read_csv_fast(trend_path, columns=RAW_SIGNAL_COLUMNS)
         dfs_with_function.append((df_trend, "Trendline"))
 
-    new_records: List[Dict[str, Any]] = []
-    for df, fn_name in dfs_with_function:
-        for _, row in df.iterrows():
-            record = build_standard_record(row, fn_name)
-            new_records.append(record)
-
-    existing_df = load_existing_csv(ALL_SIGNALS_CSV)
-    merged_by_key: Dict[str, Dict[str, Any]] = {}
+    new_df = pd.concat(
+        [build_standard_records_df(df, fn_name) for df, fn_name in dfs_with_function],
+        ignore_index=True,
+    )
 
-    if not existing_df.empty:
-        for rec in existing_df.to_dict(orient="records"):
-            key = get_trade_dedup_key_from_record(rec)
-            merged_by_key[key] = rec
+    # Existing rows first, new rows last: keep="last" lets fresh signals replace stale ones.
+    existing_df = load_signals(ALL_SIGNALS_CSV)
+    frames = [f for f in (existing_df, new_df) if not f.empty]
+    if not frames:
+        save_records_to_csv(ALL_SIGNALS_CSV, [])
+        return
 
-    for rec in new_records:
-        key = rec["Dedup_Key"]
-        merged_by_key[key] = rec
+    keys = pd.concat([get_dedup_keys(f) for f in frames], ignore_index=True)
+    merged_df = pd.concat(frames, ignore_index=True)
+    merged_df = merged_df[~keys.duplicated(keep="last")]
 
-    save_records_to_csv(ALL_SIGNALS_CSV, list(merged_by_key.values()))
+    save_records_to_csv(ALL_SIGNALS_CSV, merged_df)
     update_today_prices_for_all_signals(ALL_SIGNALS_CSV)
 
 
@@ -4,6 +4,8 @@ import re
 import pandas as pd
 import streamlit as st
 
+from utils.helpers import parse_signal_columns
+
 
 def get_latest_dated_file_path(directory, suffix):
     """
@@ -13,18 +15,117 @@ def get_latest_dated_file_path(directory, suffix):
     if not directory or not os.path.isdir(directory):
         return None
     pattern = re.compile(r"^\d{4}-\d{2}-\d{2}_" + re.escape(suffix) + r"$")
-    matching = [f for f in os.listdir(directory) if pattern.match(f)]
-    if not matching:
-        return None
-    matching.sort(reverse=True)
-    return os.path.join(directory, matching[0])
+    # ISO dates sort lexically, so the latest file is the max name; DirEntry.path is already joined
+    latest = None
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if pattern.match(entry.name) and (latest is None or entry.name > latest.name):
+                latest = entry
+    return latest.path if latest else None
+
+
+def read_csv_fast(file_path, columns=None):
+    """
+    Read a raw signal CSV (Distance/Trendline/forward_testing) with the multithreaded pyarrow engine.
+
+    Keeps the default numpy dtypes so NaN handling matches the C engine. Not meant for the
+    app-written CSVs (all_signals, potential_*, trades_bought): pyarrow parses their ISO date
+    columns into datetime.date objects and empty cells into None.
+
+    If `columns` is given, only those of them present in the file are parsed.
+    """
+    usecols = None
+    if columns is not None:
+        # pyarrow rejects callable usecols and unknown names, so intersect with the header first
+        header = pd.read_csv(file_path, sep=',', quotechar='"', encoding='utf-8', nrows=0).columns
+        usecols = [c for c in header if c in columns]
+    return pd.read_csv(file_path, sep=',', quotechar='"', encoding='utf-8', engine='pyarrow', usecols=usecols)
+
+
+@st.cache_data(show_spinner=False)
+def _load_csv_cached(file_path, mtime):
+    """Parse a CSV once per (path, mtime); Streamlit reruns reuse the cached DataFrame."""
+    return read_csv_fast(file_path)
 
 
 def load_csv(file_path):
-    """Load CSV file and return DataFrame"""
+    """Load CSV file and return DataFrame (cached until the file's mtime changes)"""
     try:
-        df = pd.read_csv(file_path, sep=',', quotechar='"', encoding='utf-8')
+        df = _load_csv_cached(file_path, os.path.getmtime(file_path))
         return df
     except Exception as e:
         st.error(f"Error loading {file_path}: {str(e)}")
-        return None
\ No newline at end of file
+        return None
+
+
+@st.cache_data(show_spinner=False)
+def _parse_csv_cached(file_path, mtime):
+    """Parse a raw signal CSV's info columns once per (path, mtime)."""
+    return parse_signal_columns(_load_csv_cached(file_path, mtime))
+
+
+def load_csv_parsed(file_path):
+    """
+    Load a raw signal CSV together with its parsed info columns (see parse_signal_columns).
+    Both come from the same cached read, so their indexes always line up. Returns (None, None) on error.
+    """
+    try:
+        mtime = os.path.getmtime(file_path)
+        return _load_csv_cached(file_path, mtime), _parse_csv_cached(file_path, mtime)
+    except Exception as e:
+        st.error(f"Error loading {file_path}: {str(e)}")
+        return None, None
+
+
+def _parquet_path(csv_path):
+    """Parquet sidecar path for a CSV (e.g. all_signals.csv -> all_signals.parquet)."""
+    return os.path.splitext(csv_path)[0] + ".parquet"
+
+
+# Low-cardinality signal columns (Long/Short, Distance/Trendline, Daily/Weekly...) loaded as categoricals
+SIGNAL_CATEGORY_COLUMNS = ("Signal_Type", "Function", "Interval")
+
+
+def load_signals(csv_path):
+    """
+    Load a signals table, preferring its Parquet sidecar when it is at least as new as the CSV.
+
+    The CSV stays the source of truth: if it was edited (or rewritten by code that does not
+    know about the sidecar) after the Parquet file, the CSV is read instead.
+    SIGNAL_CATEGORY_COLUMNS come back as `category` dtype either way.
+    Returns an empty DataFrame if the CSV is missing or empty.
+    """
+    if not os.path.exists(csv_path) or os.path.getsize(csv_path) == 0:
+        return pd.DataFrame()
+    parquet_path = _parquet_path(csv_path)
+    if os.path.exists(parquet_path) and os.path.getmtime(parquet_path) >= os.path.getmtime(csv_path):
+        try:
+            df = pd.read_parquet(parquet_path)
+        except Exception:
+            pass
+        else:
+            # Sidecars written from categorical columns already round-trip as categories
+            for col in SIGNAL_CATEGORY_COLUMNS:
+                if col in df.columns and not isinstance(df[col].dtype, pd.CategoricalDtype):
+                    df[col] = df[col].astype("category")
+            return df
+    try:
+        return pd.read_csv(csv_path, dtype=dict.fromkeys(SIGNAL_CATEGORY_COLUMNS, "category"))
+    except pd.errors.EmptyDataError:
+        return pd.DataFrame()
+
+
+def save_signals(df, csv_path):
+    """
+    Write a signals table to CSV (for humans and older readers) plus a Parquet sidecar for load_signals.
+
+    If the Parquet write fails (e.g. a column mixes numbers and strings), any stale sidecar is
+    removed so load_signals falls back to the CSV.
+    """
+    df.to_csv(csv_path, index=False)
+    parquet_path = _parquet_path(csv_path)
+    try:
+        df.to_parquet(parquet_path, index=False)
+    except Exception:
+        if os.path.exists(parquet_path):
+            os.remove(parquet_path)
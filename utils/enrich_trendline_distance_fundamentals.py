@@ -5,28 +5,80 @@ to the latest Trendline and Distance CSVs in trade_store/INDIA.
 Run after update_trade.sh so strategy cards can show these columns from the CSV.
 """
 
+import json
 import os
+import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 import pandas as pd
 import yfinance as yf
 
-from config import INDIA_DATA_DIR, DATA_FILES, YFINANCE_RATE_LIMIT_DELAY
+from config import (
+    INDIA_DATA_DIR,
+    DATA_FILES,
+    YFINANCE_RATE_LIMIT_DELAY,
+    FUNDAMENTALS_CACHE_DIR,
+    FUNDAMENTALS_CACHE_TTL_SECONDS,
+    FUNDAMENTALS_FETCH_WORKERS,
+)
 from utils.data_loader import get_latest_dated_file_path
 
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
+FUNDAMENTAL_COLUMNS = ("PE_Ratio", "Industry_PE", "Last_Quarter_Profit", "Last_Year_Same_Quarter_Profit")
+_NO_DATA = dict.fromkeys(FUNDAMENTAL_COLUMNS, "No Data")
+
+# Typical PE by Yahoo industry (falling back to sector, then 20.0)
+_INDUSTRY_PE = {
+    "Semiconductors": 25.0,
+    "Software": 30.0,
+    "Consumer Electronics": 20.0,
+    "Computer Hardware": 22.0,
+    "Information Technology Services": 28.0,
+    "Biotechnology": 35.0,
+    "Drug Manufacturers": 18.0,
+    "Medical Devices": 25.0,
+    "Healthcare Plans": 15.0,
+    "Medical Diagnostics & Research": 30.0,
+    "Banks": 12.0,
+    "Insurance": 14.0,
+    "Asset Management": 16.0,
+    "Credit Services": 10.0,
+    "Capital Markets": 18.0,
+    "Beverages": 20.0,
+    "Food": 18.0,
+    "Household & Personal Products": 22.0,
+    "Tobacco": 15.0,
+    "Apparel": 25.0,
+    "Oil & Gas": 8.0,
+    "Utilities": 16.0,
+    "Aerospace": 20.0,
+    "Engineering": 22.0,
+    "Manufacturing": 18.0,
+    "Unknown": 20.0,
+}
+
+# Everything before the first ", " (the whole value when there is none)
+_SYMBOL_PREFIX_RE = re.compile(r"^(.*?)(?:, |$)", re.DOTALL)
+
 
 def symbol_from_first_column(cell):
     """Extract symbol from first column value (e.g. 'AAPL, Long, 2026-02-06 (Price: 150)')."""
-    if cell is None or (hasattr(cell, 'isna') and pd.isna(cell)):
+    if cell is None:
         return ""
     s = str(cell).strip()
     if not s or s == "nan":
         return ""
-    if ", " in s:
-        return s.split(", ")[0].strip('"').strip()
-    return s.strip('"').strip()
+    return _SYMBOL_PREFIX_RE.match(s).group(1).strip('"').strip()
+
+
+def symbols_from_first_column(column):
+    """symbol_from_first_column for a whole column in one vectorized pass ('' where missing)."""
+    text = column.astype(str).str.strip()
+    symbols = text.str.extract(_SYMBOL_PREFIX_RE, expand=False).str.strip('"').str.strip()
+    return symbols.where(column.notna() & (text != "") & (text != "nan"), "")
 
 
 def fetch_additional_stock_data(symbol):
@@ -44,39 +96,7 @@ def fetch_additional_stock_data(symbol):
 
         industry = info.get("industry", "Unknown")
         sector = info.get("sector", "Unknown")
-
-        industry_pe_ratios = {
-            "Semiconductors": 25.0,
-            "Software": 30.0,
-            "Consumer Electronics": 20.0,
-            "Computer Hardware": 22.0,
-            "Information Technology Services": 28.0,
-            "Biotechnology": 35.0,
-            "Drug Manufacturers": 18.0,
-            "Medical Devices": 25.0,
-            "Healthcare Plans": 15.0,
-            "Medical Diagnostics & Research": 30.0,
-            "Banks": 12.0,
-            "Insurance": 14.0,
-            "Asset Management": 16.0,
-            "Credit Services": 10.0,
-            "Capital Markets": 18.0,
-            "Beverages": 20.0,
-            "Food": 18.0,
-            "Household & Personal Products": 22.0,
-            "Tobacco": 15.0,
-            "Apparel": 25.0,
-            "Oil & Gas": 8.0,
-            "Utilities": 16.0,
-            "Aerospace": 20.0,
-            "Engineering": 22.0,
-            "Manufacturing": 18.0,
-            "Unknown": 20.0,
-        }
-
-        industry_pe = industry_pe_ratios.get(
-            industry, industry_pe_ratios.get(sector, 20.0)
-        )
+        industry_pe = _INDUSTRY_PE.get(industry, _INDUSTRY_PE.get(sector, 20.0))
 
         quarterly_financials = ticker.quarterly_financials
         last_quarter_profit = "N/A"
@@ -88,16 +108,9 @@ def fetch_additional_stock_data(symbol):
             and "Net Income" in quarterly_financials.index
         ):
             net_income_series = quarterly_financials.loc["Net Income"]
-            last_available_idx = None
-            for i in range(len(net_income_series)):
-                val = net_income_series.iloc[i]
-                if pd.notna(val) and str(val).strip() not in ("", "nan", "N/A"):
-                    try:
-                        float(val)
-                        last_available_idx = i
-                        break
-                    except (ValueError, TypeError):
-                        continue
+            # Most recent quarter with a numeric value, and the same quarter a year (4 columns) earlier
+            has_value = pd.to_numeric(net_income_series, errors="coerce").notna().to_numpy()
+            last_available_idx = int(has_value.argmax()) if has_value.any() else None
 
             if last_available_idx is not None:
                 last_quarter_profit = net_income_series.iloc[last_available_idx]
@@ -130,12 +143,55 @@ def fetch_additional_stock_data(symbol):
         }
 
 
+def _cached_fundamentals(symbol):
+    """
+    fetch_additional_stock_data with a per-symbol JSON file cache in FUNDAMENTALS_CACHE_DIR.
+    Entries younger than FUNDAMENTALS_CACHE_TTL_SECONDS are reused, so the Trendline and Distance
+    CSVs (and same-day reruns) fetch each symbol once. All-"No Data" results are not cached.
+    """
+    path = os.path.join(FUNDAMENTALS_CACHE_DIR, f"{symbol.replace(os.sep, '_')}.json")
+    try:
+        with open(path, encoding="utf-8") as f:
+            entry = json.load(f)
+        if time.time() - entry["ts"] < FUNDAMENTALS_CACHE_TTL_SECONDS:
+            return entry["data"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    data = fetch_additional_stock_data(symbol)
+    if any(v != "No Data" for v in data.values()):
+        # Unique temp name + os.replace: concurrent runs never see (or leave) a half-written entry
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            payload = json.dumps({"ts": time.time(), "data": data})
+            os.makedirs(FUNDAMENTALS_CACHE_DIR, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(payload)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError):
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+    return data
+
+
+def _safe_fetch(symbol):
+    """_cached_fundamentals, returning _NO_DATA instead of raising."""
+    try:
+        return _cached_fundamentals(symbol)
+    except Exception:
+        return _NO_DATA
+
+
 def enrich_csv_with_fundamentals(file_path):
     """Add PE_Ratio, Industry_PE, Last_Quarter_Profit, Last_Year_Same_Quarter_Profit to CSV."""
     if not file_path or not os.path.isfile(file_path):
         return 0, "File not found"
+    # Every column is written back untouched, so read it as text: no type inference, no NA conversion
     try:
-        df = pd.read_csv(file_path, sep=",", quotechar='"', encoding="utf-8")
+        df = pd.read_csv(
+            file_path, sep=",", quotechar='"', encoding="utf-8", engine="c", dtype=str, na_filter=False
+        )
     except Exception as e:
         return 0, str(e)
     if df.empty:
@@ -143,35 +199,42 @@ def enrich_csv_with_fundamentals(file_path):
     cols_to_drop = [c for c in ("Signal_Open_Price", "Signal Open Price") if c in df.columns]
     if cols_to_drop:
         df = df.drop(columns=cols_to_drop)
-    updated = 0
-    pe_list, ind_pe_list, lq_list, ly_list = [], [], [], []
-    for i, row in df.iterrows():
-        sym = symbol_from_first_column(row.iloc[0])
-        if not sym:
-            pe_list.append("")
-            ind_pe_list.append("")
-            lq_list.append("")
-            ly_list.append("")
-            continue
-        try:
-            data = fetch_additional_stock_data(sym)
-            pe_list.append(data.get("PE_Ratio", "No Data"))
-            ind_pe_list.append(data.get("Industry_PE", "No Data"))
-            lq_list.append(data.get("Last_Quarter_Profit", "No Data"))
-            ly_list.append(data.get("Last_Year_Same_Quarter_Profit", "No Data"))
-            updated += 1
-        except Exception:
-            pe_list.append("No Data")
-            ind_pe_list.append("No Data")
-            lq_list.append("No Data")
-            ly_list.append("No Data")
-    df["PE_Ratio"] = pe_list
-    df["Industry_PE"] = ind_pe_list
-    df["Last_Quarter_Profit"] = lq_list
-    df["Last_Year_Same_Quarter_Profit"] = ly_list
+    symbols = symbols_from_first_column(df.iloc[:, 0])
+
+    # Fetch once per distinct symbol (a symbol often has several signal rows), in parallel
+    unique_symbols = [sym for sym in symbols.unique() if sym]
+    data_by_symbol = {}
+    if unique_symbols:
+        with ThreadPoolExecutor(max_workers=min(FUNDAMENTALS_FETCH_WORKERS, len(unique_symbols))) as executor:
+            data_by_symbol = dict(zip(unique_symbols, executor.map(_safe_fetch, unique_symbols)))
+
+    # Broadcast per-symbol values to rows; rows without a symbol get blanks
+    for col in FUNDAMENTAL_COLUMNS:
+        values = {sym: data.get(col, "No Data") for sym, data in data_by_symbol.items()}
+        values[""] = ""
+        df[col] = symbols.map(values)
+    # Only rows with fetched data count as enriched
+    failed = [sym for sym, data in data_by_symbol.items() if data is _NO_DATA]
+    updated = int((symbols.ne("") & ~symbols.isin(failed)).sum())
+    csv_text = df.to_csv(index=False)
+    # A rerun with unchanged fundamentals leaves the file (and its mtime, which keys the app's CSV cache) alone
+    try:
+        with open(file_path, encoding="utf-8", newline="") as f:
+            if f.read() == csv_text:
+                return updated, None
+    except (OSError, UnicodeDecodeError):
+        pass
+    # Write beside the original and swap it in, so a crash mid-write never truncates the CSV
+    tmp_path = file_path + ".tmp"
     try:
-        df.to_csv(file_path, index=False)
+        with open(tmp_path, "w", encoding="utf-8", newline="") as f:
+            f.write(csv_text)
+        os.replace(tmp_path, file_path)
     except Exception as e:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
         return 0, str(e)
     return updated, None
 
@@ -1,7 +1,6 @@
-import os
 import re
-from datetime import date, datetime
-from typing import Dict, Any, List, Optional, Tuple
+from datetime import date
+from typing import Dict, Any, List, Tuple, Union
 
 import pandas as pd
 
@@ -21,119 +20,13 @@ from config import (
     ENTRY_SIGNAL_RECENCY_DAYS,
     EXIT_RECENCY_DAYS,
 )
+from utils.data_loader import load_signals
 
-
-def parse_signal_column(value: str) -> Dict[str, Any]:
-    """
-    Parse 'Symbol, Signal, Signal Date/Price[$]' column.
-    Example: "HCLTECH.NS, Long, 2026-02-09 (Price: 1597.5)"
-    """
-    result = {
-        "Symbol": None,
-        "Signal_Type": None,
-        "Signal_Date": None,
-        "Signal_Price": None,
-    }
-    if not isinstance(value, str):
-        return result
-
-    parts = [p.strip() for p in value.split(",")]
-    if len(parts) < 3:
-        return result
-
-    symbol = parts[0]
-    raw_signal = parts[1].strip()
-    signal_type = "Short" if "short" in raw_signal.lower() else "Long"
-    # Re-join remaining in case there were extra commas in symbol
-    date_price_part = ",".join(parts[2:]).strip()
-
-    # Extract date and price from "YYYY-MM-DD (Price: 1597.5)"
-    date_match = re.search(r"(\d{4}-\d{2}-\d{2})", date_price_part)
-    price_match = re.search(r"Price:\s*([0-9.]+)", date_price_part)
-
-    signal_date = date_match.group(1) if date_match else None
-    signal_price = float(price_match.group(1)) if price_match else None
-
-    result["Symbol"] = symbol
-    result["Signal_Type"] = signal_type
-    result["Signal_Date"] = signal_date
-    result["Signal_Price"] = signal_price
-    return result
-
-
-def parse_win_rate_and_trades(value: str) -> Tuple[Optional[float], Optional[int]]:
-    """
-    Parse 'Win Rate [%], History Tested, Number of Trades' column.
-    Example: "92.31%, Past 4 years, 13"
-    Returns (win_rate_percent, number_of_trades)
-    """
-    if not isinstance(value, str):
-        return None, None
-    parts = [p.strip() for p in value.split(",")]
-    if len(parts) < 3:
-        return None, None
-    # First part: "92.31%"
-    win_rate_str = parts[0].replace("%", "").strip()
-    try:
-        win_rate = float(win_rate_str)
-    except ValueError:
-        win_rate = None
-
-    # Last part should contain number of trades
-    num_trades_part = parts[-1]
-    # Extract last integer from the string
-    trades_match = re.search(r"(\d+)", num_trades_part)
-    num_trades = int(trades_match.group(1)) if trades_match else None
-    return win_rate, num_trades
-
-
-def parse_today_vs_signal(value: str) -> Tuple[Optional[float], Optional[float], Optional[float]]:
-    """
-    Parse 'Today Trading Date/Price[$], Today price vs Signal'.
-    Example: "2026-02-09 (Price: 1597.5), 0.0% below"
-    Returns (today_price, pct_diff, signed_pct) where pct_diff is absolute value.
-    """
-    if not isinstance(value, str):
-        return None, None, None
-
-    price_match = re.search(r"Price:\s*([0-9.]+)", value)
-    pct_match = re.search(r"([0-9.]+)\s*% ?", value)
-
-    today_price = float(price_match.group(1)) if price_match else None
-    signed_pct = float(pct_match.group(1)) if pct_match else None
-    pct_diff = abs(signed_pct) if signed_pct is not None else None
-    return today_price, pct_diff, signed_pct
-
-
-def parse_trendpulse_start_end(value: Any) -> Tuple[Optional[float], Optional[float]]:
-    """
-    Parse 'TrendPulse Start/End (Date and Price($))'.
-    Example: "2025-12-18 (Price: 200.9578)/2026-02-09 (Price: 169.4817)"
-    Returns (start_price, end_price)
-    """
-    if not isinstance(value, str) or not value.strip():
-        return None, None
-
-    prices = re.findall(r"Price:\s*([0-9.]+)", value)
-    if len(prices) < 2:
-        return None, None
-
-    try:
-        start_price = float(prices[0])
-        end_price = float(prices[1])
-    except ValueError:
-        return None, None
-    return start_price, end_price
-
-
-def parse_interval(value: Any) -> str:
-    """
-    Parse 'Interval, Confirmation Status' column.
-    Example: "Daily, is CONFIRMED on 2026-02-09" -> "Daily"
-    """
-    if not isinstance(value, str):
-        return ""
-    return value.split(",")[0].strip()
+# Text patterns of the raw Distance/Trendline columns parsed by build_standard_records_df
+_DATE_RE = re.compile(r"(\d{4}-\d{2}-\d{2})")
+_PRICE_RE = re.compile(r"Price:\s*([0-9.]+)")
+_PCT_RE = re.compile(r"([0-9.]+)\s*% ?")
+_INT_RE = re.compile(r"(\d+)")
 
 
 def get_trade_dedup_key_from_record(record: Dict[str, Any]) -> str:
@@ -149,298 +42,281 @@ def get_trade_dedup_key_from_record(record: Dict[str, Any]) -> str:
     return "|".join(parts)
 
 
-def build_standard_record(row: pd.Series, function_name: str) -> Dict[str, Any]:
+def build_dedup_keys(df: pd.DataFrame) -> pd.Series:
+    """
+    Build deduplication keys using TRADE_DEDUP_COLUMNS for every row of df at once.
+
+    Same key format as get_trade_dedup_key_from_record.
+    """
+    parts: List[pd.Series] = []
+    for col in TRADE_DEDUP_COLUMNS:
+        if col in df.columns:
+            val = df[col].astype(str).str.strip()
+        else:
+            val = pd.Series("", index=df.index)
+        if col == "Signal_Type":
+            # Only a handful of distinct signal types: classify each category once, not each row
+            val = (
+                val.astype("category")
+                .map(lambda v: "Short" if "short" in v.lower() else "Long")
+                .astype(str)
+            )
+        parts.append(val)
+    return parts[0].str.cat(parts[1:], sep="|")
+
+
+def get_dedup_keys(df: pd.DataFrame) -> pd.Series:
+    """
+    Return the stored Dedup_Key column, building keys only for rows that lack one.
+
+    all_signals.csv and freshly built records already carry Dedup_Key, so callers
+    (the all_signals merge, the entry/exit selection) do not rehash every row on each run.
     """
-    Standardize a row from Distance/Trendline CSV into a common trade record.
+    if "Dedup_Key" not in df.columns:
+        return build_dedup_keys(df)
+    keys = df["Dedup_Key"]
+    missing = keys.isna() | (keys.astype(str).str.strip() == "")
+    if missing.any():
+        keys = keys.where(~missing, build_dedup_keys(df[missing]))
+    return keys
+
+
+def _text_column(df: pd.DataFrame, col: str) -> pd.Series:
+    """Column as object dtype with non-string cells (NaN, numbers, missing column) set to NaN."""
+    if col not in df.columns:
+        return pd.Series(float("nan"), index=df.index, dtype=object)
+    values = df[col].astype(object)
+    return values.where(values.map(lambda v: isinstance(v, str)))
+
+
+# Raw Distance/Trendline columns read by build_standard_records_df; everything else is ignored
+RAW_SIGNAL_COLUMNS = frozenset({
+    "Symbol, Signal, Signal Date/Price[$]",
+    "Win Rate [%], History Tested, Number of Trades",
+    "Today Trading Date/Price[$], Today price vs Signal",
+    "Exit Signal Date/Price[$]",
+    "Interval, Confirmation Status",
+    "PE_Ratio",
+    "Industry_PE",
+    "Last_Quarter_Profit",
+    "Last_Year_Same_Quarter_Profit",
+    "Backtested Strategy CAGR [%]",
+    "Backtested Strategy Sharpe Ratio",
+    "TrendPulse Start/End (Date and Price($))",
+})
+
+
+def build_standard_records_df(df: pd.DataFrame, function_name: str) -> pd.DataFrame:
     """
-    raw_dict = row.to_dict()
+    Standardize every row of a Distance/Trendline DataFrame into a common trade record.
 
-    signal_info = parse_signal_column(row.get("Symbol, Signal, Signal Date/Price[$]", ""))
-    win_rate, num_trades = parse_win_rate_and_trades(
-        row.get("Win Rate [%], History Tested, Number of Trades", "")
+    The raw text columns are parsed with column string/regex operations; the result has
+    one row per input row, with the columns saved to all_signals.csv plus Dedup_Key.
+    """
+    out = pd.DataFrame(index=df.index)
+
+    # 'Symbol, Signal, Signal Date/Price[$]', e.g. "HCLTECH.NS, Long, 2026-02-09 (Price: 1597.5)"
+    signal_col = _text_column(df, "Symbol, Signal, Signal Date/Price[$]")
+    signal_parts = signal_col.str.split(",", n=2, expand=True).reindex(columns=range(3))
+    signal_ok = signal_parts[2].notna()
+    date_price_part = signal_parts[2].where(signal_ok)
+    out["Symbol"] = signal_parts[0].str.strip().where(signal_ok, None)
+    out["Signal_Type"] = (
+        signal_parts[1].str.lower().str.contains("short", regex=False)
+        .map({True: "Short", False: "Long"})
+        .where(signal_ok, None)
     )
-    today_price, today_pct_diff, signed_pct = parse_today_vs_signal(
-        row.get("Today Trading Date/Price[$], Today price vs Signal", "")
+    signal_date = date_price_part.str.extract(_DATE_RE, expand=False)
+    out["Signal_Date"] = signal_date.astype(object).where(signal_date.notna(), None)
+    out["Signal_Price"] = date_price_part.str.extract(_PRICE_RE, expand=False).astype(float)
+
+    # 'Win Rate [%], History Tested, Number of Trades', e.g. "92.31%, Past 4 years, 13"
+    win_parts = _text_column(df, "Win Rate [%], History Tested, Number of Trades").str.split(",")
+    win_ok = win_parts.str.len() >= 3
+    win_rate = pd.to_numeric(
+        win_parts.str[0].str.replace("%", "", regex=False).str.strip().where(win_ok),
+        errors="coerce",
     )
-
-    pe_ratio = row.get("PE_Ratio")
-    industry_pe = row.get("Industry_PE")
-    last_q_profit = row.get("Last_Quarter_Profit")
-    last_year_q_profit = row.get("Last_Year_Same_Quarter_Profit")
-    strategy_cagr = row.get("Backtested Strategy CAGR [%]")
-    strategy_sharpe = row.get("Backtested Strategy Sharpe Ratio")
-
-    try:
-        pe_ratio = float(pe_ratio)
-    except (TypeError, ValueError):
-        pe_ratio = None
-    try:
-        industry_pe = float(industry_pe)
-    except (TypeError, ValueError):
-        industry_pe = None
-    try:
-        last_q_profit = float(last_q_profit)
-    except (TypeError, ValueError):
-        last_q_profit = None
-    try:
-        last_year_q_profit = float(last_year_q_profit)
-    except (TypeError, ValueError):
-        last_year_q_profit = None
-    try:
+    num_trades = win_parts.str[-1].where(win_ok).str.extract(_INT_RE, expand=False).astype(float)
+    out["Win_Rate"] = win_rate
+    out["Number_Of_Trades"] = num_trades if num_trades.isna().any() else num_trades.astype(int)
+    out["Win_Rate_Display"] = win_rate.map("{:.2f}%".format).where(win_rate.notna(), "")
+
+    # 'Today Trading Date/Price[$], Today price vs Signal', e.g. "2026-02-09 (Price: 1597.5), 0.0% below"
+    today_col = _text_column(df, "Today Trading Date/Price[$], Today price vs Signal")
+    signed_pct = today_col.str.extract(_PCT_RE, expand=False).astype(float)
+    out["Today_Price"] = today_col.str.extract(_PRICE_RE, expand=False).astype(float)
+    out["Today_vs_Signal_Pct"] = signed_pct.abs()
+    out["Today_vs_Signal_Pct_Signed"] = signed_pct
+
+    exit_raw = df["Exit Signal Date/Price[$]"] if "Exit Signal Date/Price[$]" in df.columns else ""
+    out["Exit_Signal_Raw"] = exit_raw
+    out["Function"] = function_name
+
+    # e.g. "Daily, is CONFIRMED on 2026-02-09" -> "Daily"
+    interval_col = _text_column(df, "Interval, Confirmation Status")
+    out["Interval"] = interval_col.str.split(",", n=1).str[0].str.strip().fillna("")
+
+    for col in ("PE_Ratio", "Industry_PE", "Last_Quarter_Profit", "Last_Year_Same_Quarter_Profit"):
+        out[col] = pd.to_numeric(df[col], errors="coerce") if col in df.columns else None
+    if "Backtested Strategy CAGR [%]" in df.columns:
         # Strategy CAGR is stored as a percent string, e.g. "24.34%"
-        strategy_cagr = float(str(strategy_cagr).replace("%", "")) if strategy_cagr not in (None, "") else None
-    except (TypeError, ValueError):
-        strategy_cagr = None
-    try:
-        strategy_sharpe = float(strategy_sharpe)
-    except (TypeError, ValueError):
-        strategy_sharpe = None
-
-    interval = parse_interval(row.get("Interval, Confirmation Status", ""))
-
-    trendpulse_start_end = row.get("TrendPulse Start/End (Date and Price($))", "")
-    start_price, end_price = parse_trendpulse_start_end(trendpulse_start_end)
-
-    record: Dict[str, Any] = {
-        "Symbol": signal_info["Symbol"],
-        "Signal_Type": signal_info["Signal_Type"],
-        "Signal_Date": signal_info["Signal_Date"],
-        "Signal_Price": signal_info["Signal_Price"],
-        "Win_Rate": win_rate,
-        "Number_Of_Trades": num_trades,
-        "Win_Rate_Display": f"{win_rate:.2f}%" if win_rate is not None else "",
-        "Today_Price": today_price,
-        "Today_vs_Signal_Pct": today_pct_diff,
-        "Today_vs_Signal_Pct_Signed": signed_pct,
-        "Exit_Signal_Raw": row.get("Exit Signal Date/Price[$]", ""),
-        "Function": function_name,
-        "Interval": interval,
-        "PE_Ratio": pe_ratio,
-        "Industry_PE": industry_pe,
-        "Last_Quarter_Profit": last_q_profit,
-        "Last_Year_Same_Quarter_Profit": last_year_q_profit,
-        "Strategy_CAGR": strategy_cagr,
-        "Strategy_Sharpe": strategy_sharpe,
-        "TrendPulse_Start_End": trendpulse_start_end,
-        "TrendPulse_Start_Price": start_price,
-        "TrendPulse_End_Price": end_price,
-        "Raw_Data": raw_dict,
-    }
-    # Also include Exit_Date/Exit_Price parsed from Exit_Signal_Raw for exits
-    exit_raw = record["Exit_Signal_Raw"]
-    if isinstance(exit_raw, str) and exit_raw and "No Exit Yet" not in exit_raw:
-        date_match = re.search(r"(\d{4}-\d{2}-\d{2})", exit_raw)
-        price_match = re.search(r"Price:\s*([0-9.]+)", exit_raw)
-        record["Exit_Date"] = date_match.group(1) if date_match else None
-        record["Exit_Price"] = float(price_match.group(1)) if price_match else None
+        cagr = df["Backtested Strategy CAGR [%]"].astype(str).str.replace("%", "", regex=False)
+        out["Strategy_CAGR"] = pd.to_numeric(cagr, errors="coerce")
+    else:
+        out["Strategy_CAGR"] = None
+    if "Backtested Strategy Sharpe Ratio" in df.columns:
+        out["Strategy_Sharpe"] = pd.to_numeric(df["Backtested Strategy Sharpe Ratio"], errors="coerce")
     else:
-        record["Exit_Date"] = None
-        record["Exit_Price"] = None
+        out["Strategy_Sharpe"] = None
+
+    # e.g. "2025-12-18 (Price: 200.9578)/2026-02-09 (Price: 169.4817)" -> start and end prices
+    trendpulse_col = "TrendPulse Start/End (Date and Price($))"
+    out["TrendPulse_Start_End"] = df[trendpulse_col] if trendpulse_col in df.columns else ""
+    trendpulse_prices = _text_column(df, trendpulse_col).str.findall(_PRICE_RE)
+    trendpulse_ok = trendpulse_prices.str.len() >= 2
+    out["TrendPulse_Start_Price"] = trendpulse_prices.str[0].where(trendpulse_ok).astype(float)
+    out["TrendPulse_End_Price"] = trendpulse_prices.str[1].where(trendpulse_ok).astype(float)
+
+    # Exit_Date/Exit_Price parsed from Exit_Signal_Raw for exits
+    exit_text = _text_column(df, "Exit Signal Date/Price[$]")
+    has_exit = exit_text.str.len().gt(0) & ~exit_text.str.contains("No Exit Yet", regex=False, na=True)
+    exit_text = exit_text.where(has_exit)
+    exit_date = exit_text.str.extract(_DATE_RE, expand=False)
+    out["Exit_Date"] = exit_date.astype(object).where(exit_date.notna(), None)
+    out["Exit_Price"] = exit_text.str.extract(_PRICE_RE, expand=False).astype(float)
+
+    # Dedup key (same format as get_trade_dedup_key_from_record; None parts render as "None")
+    key_parts: List[pd.Series] = []
+    for col in TRADE_DEDUP_COLUMNS:
+        if col == "Signal_Type":
+            key_parts.append(out[col].eq("Short").map({True: "Short", False: "Long"}))
+        else:
+            key_parts.append(out[col].astype(str).str.strip())
+    out["Dedup_Key"] = key_parts[0].str.cat(key_parts[1:], sep="|")
+    return out
+
+
+def _str_column(df: pd.DataFrame, col: str) -> pd.Series:
+    """str() of every cell ('' when the column is missing)."""
+    if col not in df.columns:
+        return pd.Series("", index=df.index)
+    return df[col].astype(str)
+
+
+def _numeric_column(df: pd.DataFrame, col: str) -> Tuple[pd.Series, pd.Series]:
+    """
+    Column as floats plus a mask of cells the conditions reject as missing (None,
+    non-numeric text, or no such column). NaN is not "missing": it fails every comparison,
+    so a `~(x <= limit)` check lets it through while a `x > limit` check does not.
+    """
+    if col not in df.columns:
+        return pd.Series(float("nan"), index=df.index), pd.Series(True, index=df.index)
+    values = df[col]
+    numbers = pd.to_numeric(values, errors="coerce")
+    is_none = pd.Series(values.to_numpy(dtype=object) == None, index=df.index)  # noqa: E711
+    return numbers, is_none | (numbers.isna() & values.notna())
 
-    # Dedup key
-    record["Dedup_Key"] = get_trade_dedup_key_from_record(record)
-    return record
 
+def _dates_column(df: pd.DataFrame, col: str) -> pd.Series:
+    """First 10 chars of each cell parsed as YYYY-MM-DD (NaT where missing or unparseable)."""
+    text = _str_column(df, col).str.strip().str[:10]
+    return pd.to_datetime(text, format="%Y-%m-%d", errors="coerce")
 
-def entry_conditions(record: Dict[str, Any]) -> bool:
+
+def _common_conditions_mask(df: pd.DataFrame) -> pd.Series:
+    """Long-only, win-rate/trade-count, PE, profit and Trendline TrendPulse conditions shared by entries and exits."""
+    mask = _str_column(df, "Signal_Type").str.strip().str.upper().eq("LONG")
+
+    win_rate, win_rate_missing = _numeric_column(df, "Win_Rate")
+    num_trades, num_trades_missing = _numeric_column(df, "Number_Of_Trades")
+    mask &= ~win_rate_missing & ~num_trades_missing
+    mask &= ~(win_rate <= ENTRY_EXIT_MIN_WIN_RATE) & ~(num_trades <= ENTRY_EXIT_MIN_NUM_TRADES)
+
+    pe_ratio, pe_ratio_missing = _numeric_column(df, "PE_Ratio")
+    industry_pe, industry_pe_missing = _numeric_column(df, "Industry_PE")
+    mask &= ~pe_ratio_missing & ~industry_pe_missing
+    mask &= (industry_pe > pe_ratio) & (pe_ratio < ENTRY_EXIT_MAX_PE_RATIO)
+
+    last_q, last_q_missing = _numeric_column(df, "Last_Quarter_Profit")
+    last_year_q, last_year_q_missing = _numeric_column(df, "Last_Year_Same_Quarter_Profit")
+    mask &= ~last_q_missing & ~last_year_q_missing
+    mask &= last_q > ENTRY_EXIT_PROFIT_RATIO * last_year_q
+
+    start_price, start_missing = _numeric_column(df, "TrendPulse_Start_Price")
+    end_price, end_missing = _numeric_column(df, "TrendPulse_End_Price")
+    is_trendline = _str_column(df, "Function").str.lower().eq("trendline")
+    mask &= ~is_trendline | (~start_missing & ~end_missing & (start_price > end_price))
+    return mask
+
+
+def entry_mask(df: pd.DataFrame) -> pd.Series:
     """
-    Apply all entry conditions specified by the user.
+    Boolean mask of the rows of a standardized signals DataFrame (e.g. all_signals.csv)
+    that qualify as potential entries.
 
     Conditions:
     - Long signals only (buy trades)
-    - Win Rate [%] > 80
-    - Number of Trades > 6
+    - Win_Rate > ENTRY_EXIT_MIN_WIN_RATE and Number_Of_Trades > ENTRY_EXIT_MIN_NUM_TRADES
     - Exit signal is "No Exit Yet"
-    - Signal date within 7 days of fetch date (signal recency)
-    - |today price vs signal| < 1%
-    - Industry PE > PE ratio
-    - PE ratio < 50
-    - Last_Quarter_Profit > 0.5 * Last_Year_Same_Quarter_Profit
+    - Signal date within ENTRY_SIGNAL_RECENCY_DAYS of today (signal recency)
+    - Signed today vs signal price strictly between ENTRY_PRICE_BAND_PCT_BELOW and ENTRY_PRICE_BAND_PCT_ABOVE
+    - Industry PE > PE ratio and PE ratio < ENTRY_EXIT_MAX_PE_RATIO
+    - Last_Quarter_Profit > ENTRY_EXIT_PROFIT_RATIO * Last_Year_Same_Quarter_Profit
     - For Trendline function: TrendPulse start price > TrendPulse end price
     """
-    # Long only
-    signal_type = str(record.get("Signal_Type", "")).strip().upper()
-    if signal_type != "LONG":
-        return False
-
-    # Signal date recency check (within ENTRY_SIGNAL_RECENCY_DAYS of fetch date)
-    signal_date_str = record.get("Signal_Date")
-    if not signal_date_str:
-        return False
-    try:
-        signal_dt = datetime.strptime(str(signal_date_str).strip()[:10], "%Y-%m-%d").date()
-        fetch_date = date.today()  # Use today as fetch date
-        days_since_signal = (fetch_date - signal_dt).days
-        if days_since_signal > ENTRY_SIGNAL_RECENCY_DAYS or days_since_signal < 0:
-            return False
-    except (ValueError, TypeError):
-        return False
-
-    # Win rate & number of trades
-    win_rate = record.get("Win_Rate")
-    num_trades = record.get("Number_Of_Trades")
-    if win_rate is None or num_trades is None:
-        return False
-    if win_rate <= ENTRY_EXIT_MIN_WIN_RATE:
-        return False
-    if num_trades <= ENTRY_EXIT_MIN_NUM_TRADES:
-        return False
-
-    # Exit signal must be "No Exit Yet"
-    exit_raw = str(record.get("Exit_Signal_Raw", "")).strip().lower()
-    if "no exit yet" not in exit_raw:
-        return False
-
-    # Today vs signal price difference band based on the latest Today_Price.
-    # NOTE: We use the **signed** percentage (no abs) and keep only trades
-    # where the price is between -3% and +1% vs the signal price:
-    # - Reject if already >= +1% above (too much unrealised profit taken)
-    # - Reject if <= -3% below (too deep a dip from signal)
-    price_now = record.get("Today_Price")
-    signal_price = record.get("Signal_Price")
-    if price_now is None or signal_price is None:
-        return False
-    try:
-        price_now = float(price_now)
-        signal_price = float(signal_price)
-    except (TypeError, ValueError):
-        return False
-    if signal_price <= 0:
-        return False
+    mask = _common_conditions_mask(df)
+
+    # Signal date within ENTRY_SIGNAL_RECENCY_DAYS of today (unparseable dates fail)
+    days_since_signal = (pd.Timestamp(date.today()) - _dates_column(df, "Signal_Date")).dt.days
+    mask &= days_since_signal.between(0, ENTRY_SIGNAL_RECENCY_DAYS)
+
+    mask &= _str_column(df, "Exit_Signal_Raw").str.strip().str.lower().str.contains("no exit yet", regex=False)
+
+    # Signed today-vs-signal price band
+    price_now, price_now_missing = _numeric_column(df, "Today_Price")
+    signal_price, signal_price_missing = _numeric_column(df, "Signal_Price")
+    mask &= ~price_now_missing & ~signal_price_missing & ~(signal_price <= 0)
     pct_diff = (price_now - signal_price) / signal_price * 100.0
-    # Reject if price is at least ENTRY_PRICE_BAND_PCT_ABOVE above, or more than |ENTRY_PRICE_BAND_PCT_BELOW| below, signal price
-    if pct_diff >= ENTRY_PRICE_BAND_PCT_ABOVE or pct_diff <= ENTRY_PRICE_BAND_PCT_BELOW:
-        return False
-
-    # PE conditions
-    pe_ratio = record.get("PE_Ratio")
-    industry_pe = record.get("Industry_PE")
-    if pe_ratio is None or industry_pe is None:
-        return False
-    if not (industry_pe > pe_ratio):
-        return False
-    if not (pe_ratio < ENTRY_EXIT_MAX_PE_RATIO):
-        return False
-
-    # Profit condition
-    last_q = record.get("Last_Quarter_Profit")
-    last_year_q = record.get("Last_Year_Same_Quarter_Profit")
-    if last_q is None or last_year_q is None:
-        return False
-    if not (last_q > ENTRY_EXIT_PROFIT_RATIO * last_year_q):
-        return False
-
-    # Trendline-specific TrendPulse condition
-    if str(record.get("Function", "")).lower() == "trendline":
-        start_price = record.get("TrendPulse_Start_Price")
-        end_price = record.get("TrendPulse_End_Price")
-        if start_price is None or end_price is None:
-            return False
-        if not (start_price > end_price):
-            return False
-
-    return True
-
-
-def exit_conditions(record: Dict[str, Any], fetch_date: date) -> bool:
+    mask &= ~(pct_diff >= ENTRY_PRICE_BAND_PCT_ABOVE) & ~(pct_diff <= ENTRY_PRICE_BAND_PCT_BELOW)
+    return mask
+
+
+def exit_mask(df: pd.DataFrame, fetch_date: date) -> pd.Series:
     """
-    Apply exit conditions derived from entry conditions, with the following differences:
+    Boolean mask of the rows of a standardized signals DataFrame that qualify as
+    potential exits as of `fetch_date`.
 
+    Same as entry_mask, with the following differences:
     - Exit signal must NOT be "No Exit Yet" (i.e. must have Exit_Date and Exit_Price).
-    - (fetch_date - Exit_Date) in days must be <= 3.
-    - No profit > 1% filter here; all qualifying exits are kept.
+    - (fetch_date - Exit_Date) in days must be <= EXIT_RECENCY_DAYS.
+    - No signal recency or today-price band filter; all qualifying exits are kept.
     """
-    # Long only
-    signal_type = str(record.get("Signal_Type", "")).strip().upper()
-    if signal_type != "LONG":
-        return False
-
-    # Win rate & number of trades
-    win_rate = record.get("Win_Rate")
-    num_trades = record.get("Number_Of_Trades")
-    if win_rate is None or num_trades is None:
-        return False
-    if win_rate <= ENTRY_EXIT_MIN_WIN_RATE:
-        return False
-    if num_trades <= ENTRY_EXIT_MIN_NUM_TRADES:
-        return False
-
-    # Exit signal must be present (not "No Exit Yet")
-    exit_raw = str(record.get("Exit_Signal_Raw", "")).strip().lower()
-    if not exit_raw or "no exit yet" in exit_raw:
-        return False
-
-    # Exit_Date within last 3 days relative to fetch_date
-    exit_date_str = record.get("Exit_Date")
-    if not exit_date_str:
-        return False
-    try:
-        exit_dt = datetime.strptime(str(exit_date_str).strip()[:10], "%Y-%m-%d").date()
-    except (ValueError, TypeError):
-        return False
-    if (fetch_date - exit_dt).days > EXIT_RECENCY_DAYS:
-        return False
-
-    # Require Exit_Price to be present
-    if record.get("Exit_Price") is None:
-        return False
-
-    # PE conditions (same as entry)
-    pe_ratio = record.get("PE_Ratio")
-    industry_pe = record.get("Industry_PE")
-    if pe_ratio is None or industry_pe is None:
-        return False
-    if not (industry_pe > pe_ratio):
-        return False
-    if not (pe_ratio < ENTRY_EXIT_MAX_PE_RATIO):
-        return False
-
-    # Profit condition (same as entry)
-    last_q = record.get("Last_Quarter_Profit")
-    last_year_q = record.get("Last_Year_Same_Quarter_Profit")
-    if last_q is None or last_year_q is None:
-        return False
-    if not (last_q > ENTRY_EXIT_PROFIT_RATIO * last_year_q):
-        return False
-
-    # Trendline-specific TrendPulse condition (same as entry)
-    if str(record.get("Function", "")).lower() == "trendline":
-        start_price = record.get("TrendPulse_Start_Price")
-        end_price = record.get("TrendPulse_End_Price")
-        if start_price is None or end_price is None:
-            return False
-        if not (start_price > end_price):
-            return False
-
-    return True
-
-
-def load_existing_csv(path: str) -> pd.DataFrame:
-    """Load a CSV if it exists, otherwise return empty DataFrame."""
-    if not os.path.exists(path) or os.path.getsize(path) == 0:
-        return pd.DataFrame()
-    try:
-        return pd.read_csv(path)
-    except pd.errors.EmptyDataError:
-        return pd.DataFrame()
-
-
-def save_records_to_csv(path: str, records: List[Dict[str, Any]]) -> None:
+    mask = _common_conditions_mask(df)
+
+    exit_raw = _str_column(df, "Exit_Signal_Raw").str.strip().str.lower()
+    mask &= exit_raw.ne("") & ~exit_raw.str.contains("no exit yet", regex=False)
+
+    # Exit date no more than EXIT_RECENCY_DAYS before fetch_date (unparseable dates fail)
+    days_since_exit = (pd.Timestamp(fetch_date) - _dates_column(df, "Exit_Date")).dt.days
+    mask &= days_since_exit <= EXIT_RECENCY_DAYS
+
+    _, exit_price_missing = _numeric_column(df, "Exit_Price")
+    mask &= ~exit_price_missing
+    return mask
+
+
+def save_records_to_csv(path: str, records: Union[pd.DataFrame, List[Dict[str, Any]]]) -> None:
     """
-    Save potential entry/exit records to CSV with only the fields
-    required by the Potential pages and entry/exit logic.
+    Save potential entry/exit records (a DataFrame or list of dicts) to CSV with only
+    the fields required by the Potential pages and entry/exit logic.
     """
-    if not records:
+    if len(records) == 0:
         pd.DataFrame().to_csv(path, index=False)
         return
 
-    flattened: List[Dict[str, Any]] = []
-    for rec in records:
-        rec_copy = dict(rec)
-        rec_copy.pop("Raw_Data", None)
-        flattened.append(rec_copy)
-
-    df = pd.DataFrame(flattened)
+    # Raw_Data is not a core column, so the selection below drops it without per-record copies.
+    df = pd.DataFrame(records)
 
     core_columns = [
         "Symbol",
@@ -482,39 +358,19 @@ def main() -> None:
     data source changes from raw Distance/Trendline CSVs to the
     deduplicated, enriched `all_signals.csv` produced by utils.all_signals_fetcher.
     """
-    all_signals_df = load_existing_csv(ALL_SIGNALS_CSV)
+    all_signals_df = load_signals(ALL_SIGNALS_CSV)
     if all_signals_df.empty:
         raise FileNotFoundError("all_signals.csv is empty or missing. Run utils.all_signals_fetcher first.")
 
-    all_records: List[Dict[str, Any]] = []
-    for rec in all_signals_df.to_dict(orient="records"):
-        if not rec.get("Dedup_Key"):
-            rec["Dedup_Key"] = get_trade_dedup_key_from_record(rec)
-        all_records.append(rec)
+    # Rows stay in the DataFrame end to end: fill missing keys, mask, write the selected rows
+    all_signals_df["Dedup_Key"] = get_dedup_keys(all_signals_df)
 
     # --- ENTRY LOGIC: fully recompute potential_entry.csv from all_signals ---
-    entry_records: List[Dict[str, Any]] = []
-    for record in all_records:
-        if entry_conditions(record):
-            entry_records.append(record)
-
-    if entry_records:
-        save_records_to_csv(POTENTIAL_ENTRY_CSV, entry_records)
-    else:
-        pd.DataFrame().to_csv(POTENTIAL_ENTRY_CSV, index=False)
+    save_records_to_csv(POTENTIAL_ENTRY_CSV, all_signals_df[entry_mask(all_signals_df)])
 
     # --- EXIT LOGIC: select exit trades directly from all_signals.csv ---
     fetch_date = date.today()
-
-    exit_records: List[Dict[str, Any]] = []
-    for record in all_records:
-        if exit_conditions(record, fetch_date):
-            exit_records.append(record)
-
-    if exit_records:
-        save_records_to_csv(POTENTIAL_EXIT_CSV, exit_records)
-    else:
-        pd.DataFrame().to_csv(POTENTIAL_EXIT_CSV, index=False)
+    save_records_to_csv(POTENTIAL_EXIT_CSV, all_signals_df[exit_mask(all_signals_df, fetch_date)])
 
 
 if __name__ == "__main__":
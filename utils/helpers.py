@@ -1,5 +1,7 @@
 import re
 
+import pandas as pd
+
 
 def parse_symbol_signal_info(symbol_signal_info):
     """Parse symbol, signal type, date and price from CSV column"""
@@ -43,4 +45,61 @@ def parse_win_rate_info(win_rate_info):
             parts = win_rate_info.split(', ')
             if len(parts) >= 1:
                 win_rate = parts[0].strip('"') + "%"
-    return win_rate
\ No newline at end of file
+    return win_rate
+
+
+def parse_symbol_column(column):
+    """Parse symbols from a whole 'Symbol, Signal, Signal Date/Price[$]' column ('' where missing)"""
+    text = column.astype(str)
+    symbols = text.str.split(', ', n=1).str[0].str.strip('"').str.strip()
+    return symbols.where(column.notna() & (text != 'nan'), "")
+
+def parse_win_rate_column(column):
+    """
+    Parse win rate [%] from a whole 'Win Rate [%], History Tested, Number of Trades' column.
+    NaN where the cell has no ', ' separator or the rate is not numeric.
+    """
+    text = column.astype(str)
+    rates = pd.to_numeric(text.str.split(', ', n=1).str[0].str.strip('"').str.strip('%'), errors='coerce')
+    return rates.where(text.str.contains(', ', regex=False))
+
+SYMBOL_SIGNAL_PATTERN = r'^"?(?P<Symbol>[^,]*?)"?, (?P<Signal>[^,]*), (?P<Signal_Date>.*?) \(Price: (?P<Signal_Price>[^)]*)\)'
+
+def parse_signal_columns(df):
+    """
+    Parse a raw signal table's info columns into typed columns in one vectorized pass:
+    Symbol, Signal_Type, Signal_Date, Signal_Price, Interval_Display, Win_Rate_Num and Has_Win_Rate.
+
+    Column-wise counterpart of parse_symbol_signal_info, parse_interval_info and parse_win_rate_info;
+    Symbol is '' and Win_Rate_Num NaN where missing, as in parse_symbol_column/parse_win_rate_column.
+    """
+    parsed = pd.DataFrame(index=df.index)
+    if len(df.columns) == 0:
+        return parsed
+
+    symbol_info = df.iloc[:, 0]
+    parsed["Symbol"] = parse_symbol_column(symbol_info)
+    parts = symbol_info.astype(str).str.extract(SYMBOL_SIGNAL_PATTERN)
+    matched = parts["Signal"].notna()
+    is_short = parts["Signal"].str.contains("short", case=False, regex=False).fillna(False).astype(bool)
+    parsed["Signal_Type"] = "Unknown"
+    parsed.loc[matched, "Signal_Type"] = is_short[matched].map({True: "Short", False: "Long"})
+    parsed["Signal_Date"] = parts["Signal_Date"].str.strip().fillna("Unknown")
+    parsed["Signal_Price"] = parts["Signal_Price"].str.strip().fillna("N/A")
+
+    if len(df.columns) > 4:
+        interval_info = df.iloc[:, 4]
+        interval_text = interval_info.astype(str)
+        intervals = interval_text.str.split(', ', n=1).str[0].str.strip('"')
+        parsed["Interval_Display"] = intervals.where(interval_info.notna() & (interval_text != 'nan'), "Unknown")
+    else:
+        parsed["Interval_Display"] = "Unknown"
+
+    if len(df.columns) > 3:
+        win_rate_info = df.iloc[:, 3]
+        parsed["Win_Rate_Num"] = parse_win_rate_column(win_rate_info)
+        parsed["Has_Win_Rate"] = win_rate_info.notna() & ~win_rate_info.astype(str).isin(["", "nan"])
+    else:
+        parsed["Win_Rate_Num"] = float("nan")
+        parsed["Has_Win_Rate"] = False
+    return parsed
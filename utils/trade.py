@@ -10,7 +10,7 @@ from __future__ import annotations
 
 import json
 import os
-from datetime import datetime, date
+from datetime import date
 from typing import Any
 
 import pandas as pd
@@ -69,8 +69,9 @@ def fetch_current_price_yfinance(symbol: str | Any) -> float | None:
     if not os.path.isfile(csv_path):
         return None
 
+    # Only Date and Close are used: skip parsing the OHLV columns (a callable tolerates either being absent)
     try:
-        df = pd.read_csv(csv_path)
+        df = pd.read_csv(csv_path, usecols=lambda c: c in ("Date", "Close"), dtype={"Date": str})
     except Exception:
         return None
 
@@ -106,7 +107,7 @@ def _get_data_fetch_date() -> date | None:
         d = data.get("date") or (data.get("datetime", "")[:10] if data.get("datetime") else None)
         if not d:
             return None
-        return datetime.strptime(str(d)[:10], "%Y-%m-%d").date()
+        return date.fromisoformat(str(d)[:10])
     except Exception:
         return None
 
@@ -260,11 +261,11 @@ def display_monitored_trades_metrics(
                 sig_date_str = row.get("Signal_Date")
                 if not sig_date_str or pd.isna(sig_date_str):
                     continue
-                sig_date = datetime.strptime(str(sig_date_str)[:10], "%Y-%m-%d").date()
+                sig_date = date.fromisoformat(str(sig_date_str)[:10])
                 if row.get("Status") == "Closed":
                     exit_date_str = row.get("Exit_Date")
                     if exit_date_str and str(exit_date_str).strip() and str(exit_date_str).lower() != "nan":
-                        exit_d = datetime.strptime(str(exit_date_str)[:10], "%Y-%m-%d").date()
+                        exit_d = date.fromisoformat(str(exit_date_str)[:10])
                         holding_days_list.append((exit_d - sig_date).days)
                 else:
                     holding_days_list.append((fetch_date - sig_date).days)
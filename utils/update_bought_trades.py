@@ -8,28 +8,16 @@ This module updates trades_bought.csv by:
 """
 
 import os
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Set
 
 import pandas as pd
 
 from config import (
     TRADES_BOUGHT_CSV,
     ALL_SIGNALS_CSV,
-    TRADE_DEDUP_COLUMNS,
 )
-
-
-def get_trade_dedup_key_from_record(record: Dict[str, Any]) -> str:
-    """
-    Build deduplication key using TRADE_DEDUP_COLUMNS.
-    """
-    parts: List[str] = []
-    for col in TRADE_DEDUP_COLUMNS:
-        val = str(record.get(col, "")).strip()
-        if col == "Signal_Type":
-            val = "Short" if "short" in val.lower() else "Long"
-        parts.append(val)
-    return "|".join(parts)
+from utils.data_loader import load_signals
+from utils.entry_exit_fetcher import get_dedup_keys, get_trade_dedup_key_from_record
 
 
 def load_bought_trades() -> List[Dict[str, Any]]:
@@ -47,25 +35,27 @@ def load_bought_trades() -> List[Dict[str, Any]]:
         return []
 
 
-def load_all_signals() -> Dict[str, Dict[str, Any]]:
+def load_all_signals(wanted_keys: Optional[Set[str]] = None) -> Dict[str, Dict[str, Any]]:
     """
     Load all_signals.csv and create a lookup dictionary keyed by Dedup_Key.
+
+    If wanted_keys is given, only rows with those keys are turned into dicts, so the
+    lookup stays as small as the bought trades instead of the whole signal history.
     """
-    if not os.path.exists(ALL_SIGNALS_CSV):
-        return {}
-    if os.path.getsize(ALL_SIGNALS_CSV) == 0:
-        return {}
     try:
-        df = pd.read_csv(ALL_SIGNALS_CSV)
+        df = load_signals(ALL_SIGNALS_CSV)
         if df.empty:
             return {}
-        
+
+        if wanted_keys is not None and "Dedup_Key" in df.columns:
+            stored = df["Dedup_Key"]
+            has_key = stored.notna() & (stored.astype(str) != "")
+            df = df[~has_key | stored.isin(wanted_keys)]
+
+        # Generate dedup keys (column-wise) for rows that lack one
+        df = df.assign(Dedup_Key=get_dedup_keys(df))
         lookup: Dict[str, Dict[str, Any]] = {}
         for record in df.to_dict("records"):
-            # Generate dedup key if not present
-            if not record.get("Dedup_Key"):
-                record["Dedup_Key"] = get_trade_dedup_key_from_record(record)
-            
             dedup_key = record["Dedup_Key"]
             if dedup_key:
                 lookup[dedup_key] = record
@@ -180,7 +170,6 @@ def enrich_bought_trades_from_signals() -> Dict[str, Any]:
     """
     # Load data
     bought_trades = load_bought_trades()
-    all_signals_lookup = load_all_signals()
     
     if not bought_trades:
         return {
@@ -190,16 +179,17 @@ def enrich_bought_trades_from_signals() -> Dict[str, Any]:
             "unmatched_symbols": [],
         }
     
+    for bought_record in bought_trades:
+        if not bought_record.get("Dedup_Key"):
+            bought_record["Dedup_Key"] = get_trade_dedup_key_from_record(bought_record)
+    all_signals_lookup = load_all_signals({r["Dedup_Key"] for r in bought_trades})
+    
     matched_count = 0
     unmatched_count = 0
     unmatched_symbols = []
     enriched_trades = []
     
     for bought_record in bought_trades:
-        # Generate dedup key for this bought trade
-        if not bought_record.get("Dedup_Key"):
-            bought_record["Dedup_Key"] = get_trade_dedup_key_from_record(bought_record)
-        
         dedup_key = bought_record["Dedup_Key"]
         
         # Look up matching signal